@@ -10,7 +10,6 @@ import socket
 import struct
 import time
 import logging
-import binascii
 import threading
 from datetime import datetime
 
@@ -258,8 +257,7 @@ class FR900InventoryClient:
     
     def _read_tags_single(self, duration):
         """단일 실행 모드 (지정된 시간 동안)"""
-        start_time = time.time()
-        end_time = start_time + duration
+        end_time = time.monotonic() + duration
         
         tag_reports = []
         unique_epcs = set()
@@ -271,7 +269,7 @@ class FR900InventoryClient:
         print(f" RFID 인벤토리 실행 중... ({duration}초)")
         print("="*60)
         
-        while time.time() < end_time:
+        while time.monotonic() < end_time:
             msg_type, msg_id, data = self.recv_message()
             
             if msg_type is None:
@@ -468,7 +466,7 @@ class FR900InventoryClient:
                     if param_type == 0x00F1:  # EPC-96
                         if len(param_data) >= 2:
                             epc_bytes = param_data[2:]  # flags 건너뛰기
-                            info['epc'] = binascii.hexlify(epc_bytes).decode().upper()
+                            info['epc'] = epc_bytes.hex().upper()
                             logger.debug(f"EPC 추출: {info['epc']}")
                 
                     elif param_type == 0x0081:  # FirstSeenTimestampUTC
@@ -524,7 +522,7 @@ class FR900InventoryClient:
                         epc_len = param_len - 6
                         if epc_start + epc_len <= len(tag_data):
                             epc_bytes = tag_data[epc_start:epc_start+epc_len]
-                            return binascii.hexlify(epc_bytes).decode().upper()
+                            return epc_bytes.hex().upper()
             return None
         except:
             return None
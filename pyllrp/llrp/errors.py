@@ -64,106 +64,122 @@ class LLRPStatusCode(IntEnum):
     A_OutOfRange = 502
 
 
+# Code -> name, so unknown codes don't cost a ValueError on every lookup
+_STATUS_NAMES = {code.value: code.name for code in LLRPStatusCode}
+
+_M_SUCCESS = int(LLRPStatusCode.M_Success)
+
+
 class LLRPError(Exception):
     """Base LLRP Exception"""
     
+    # Attributes live in slots, so the instance __dict__ is never materialised
+    __slots__ = ('status_code', 'description', 'details', 'status_name')
+    
     def __init__(self, status_code: int, description: str = "", details: Optional[dict] = None):
         self.status_code = status_code
         self.description = description
         self.details = details or {}
         
         # Get human-readable status name
-        try:
-            self.status_name = LLRPStatusCode(status_code).name
-        except ValueError:
-            self.status_name = f"UnknownStatus_{status_code}"
+        self.status_name = _STATUS_NAMES.get(status_code) or f"UnknownStatus_{status_code}"
         
         super().__init__(f"LLRP Error {status_code} ({self.status_name}): {description}")
+    
+    def __reduce__(self):
+        # BaseException pickles args + __dict__, which would lose the slots
+        return (self.__class__, (self.status_code, self.description, self.details))
 
 
 class LLRPParameterError(LLRPError):
     """LLRP Parameter-related errors"""
-    pass
+    __slots__ = ()
 
 
 class LLRPROSpecError(LLRPError):
     """LLRP ROSpec-related errors"""
-    pass
+    __slots__ = ()
 
 
 class LLRPDeviceError(LLRPError):
     """LLRP Device-related errors"""
-    pass
+    __slots__ = ()
 
 
 class LLRPConnectionError(LLRPError):
     """LLRP Connection-related errors"""
-    pass
+    __slots__ = ()
 
 
 class LLRPTimeoutError(LLRPError):
     """LLRP Timeout errors"""
+    __slots__ = ('timeout_seconds',)
     
     def __init__(self, description: str = "Operation timed out", timeout_seconds: float = 0):
         super().__init__(LLRPStatusCode.M_Other, description, {'timeout': timeout_seconds})
         self.timeout_seconds = timeout_seconds
+    
+    def __reduce__(self):
+        return (self.__class__, (self.description, self.timeout_seconds))
 
 
-def get_error_description(status_code: int) -> str:
-    """Get human-readable description for LLRP status code"""
+# Human-readable description per status code
+_ERROR_DESCRIPTIONS = {
+    # Success
+    LLRPStatusCode.M_Success: "Operation completed successfully",
     
-    descriptions = {
-        # Success
-        LLRPStatusCode.M_Success: "Operation completed successfully",
-        
-        # Parameter Errors
-        LLRPStatusCode.M_ParameterError: "General parameter error",
-        LLRPStatusCode.M_FieldError: "Field contains invalid value",
-        LLRPStatusCode.M_UnexpectedParameter: "Unexpected parameter encountered",
-        LLRPStatusCode.M_MissingParameter: "Required parameter missing",
-        LLRPStatusCode.M_DuplicateParameter: "Duplicate parameter not allowed",
-        LLRPStatusCode.M_OverflowParameter: "Too many parameters",
-        LLRPStatusCode.M_OverflowField: "Field value out of range",
-        LLRPStatusCode.M_UnknownParameter: "Parameter type not recognized",
-        LLRPStatusCode.M_UnknownField: "Field not recognized",
-        LLRPStatusCode.M_UnsupportedMessage: "Message type not supported",
-        LLRPStatusCode.M_UnsupportedVersion: "LLRP version not supported",
-        LLRPStatusCode.M_UnsupportedParameter: "Parameter not supported",
-        
-        # ROSpec Errors
-        LLRPStatusCode.M_NoSuchROSpec: "ROSpec with specified ID does not exist",
-        LLRPStatusCode.M_NoSuchAccessSpec: "AccessSpec with specified ID does not exist",
-        LLRPStatusCode.M_ROSpecCurrentlyDisabled: "ROSpec is currently disabled",
-        LLRPStatusCode.M_ROSpecCurrentlyEnabled: "ROSpec is currently enabled",
-        LLRPStatusCode.M_NoMoreROSpecs: "Maximum number of ROSpecs reached",
-        LLRPStatusCode.M_NoMoreAccessSpecs: "Maximum number of AccessSpecs reached",
-        LLRPStatusCode.M_AccessSpecCurrentlyDisabled: "AccessSpec is currently disabled",
-        LLRPStatusCode.M_AccessSpecCurrentlyEnabled: "AccessSpec is currently enabled",
-        LLRPStatusCode.M_ROSpecNotConfigured: "ROSpec configuration incomplete",
-        LLRPStatusCode.M_AccessSpecNotConfigured: "AccessSpec configuration incomplete",
-        
-        # Device Errors
-        LLRPStatusCode.M_DeviceError: "General device error",
-        LLRPStatusCode.M_OutOfRange: "Requested value out of supported range",
-        LLRPStatusCode.M_NoAntennaConnected: "No antenna connected to specified port",
-        LLRPStatusCode.M_ReaderTemperatureTooHigh: "Reader temperature exceeds safe operating limit",
-        LLRPStatusCode.M_ReaderOverheated: "Reader has overheated and shut down",
-        LLRPStatusCode.M_ReaderInitializationFailure: "Reader failed to initialize properly",
-        
-        # Air Protocol Errors
-        LLRPStatusCode.M_InvalidFrequency: "Specified frequency not supported",
-        LLRPStatusCode.M_InvalidAntennaID: "Invalid antenna ID specified",
-        LLRPStatusCode.M_InvalidPowerLevel: "Power level out of supported range",
-        LLRPStatusCode.M_CycleCountExceeded: "Maximum cycle count exceeded",
-        LLRPStatusCode.M_InvalidParameter: "Parameter value invalid for current configuration",
-        
-        # Other Errors
-        LLRPStatusCode.M_Other: "Other error not specified above",
-        LLRPStatusCode.A_Invalid: "Invalid parameter value",
-        LLRPStatusCode.A_OutOfRange: "Parameter value out of range",
-    }
+    # Parameter Errors
+    LLRPStatusCode.M_ParameterError: "General parameter error",
+    LLRPStatusCode.M_FieldError: "Field contains invalid value",
+    LLRPStatusCode.M_UnexpectedParameter: "Unexpected parameter encountered",
+    LLRPStatusCode.M_MissingParameter: "Required parameter missing",
+    LLRPStatusCode.M_DuplicateParameter: "Duplicate parameter not allowed",
+    LLRPStatusCode.M_OverflowParameter: "Too many parameters",
+    LLRPStatusCode.M_OverflowField: "Field value out of range",
+    LLRPStatusCode.M_UnknownParameter: "Parameter type not recognized",
+    LLRPStatusCode.M_UnknownField: "Field not recognized",
+    LLRPStatusCode.M_UnsupportedMessage: "Message type not supported",
+    LLRPStatusCode.M_UnsupportedVersion: "LLRP version not supported",
+    LLRPStatusCode.M_UnsupportedParameter: "Parameter not supported",
+    
+    # ROSpec Errors
+    LLRPStatusCode.M_NoSuchROSpec: "ROSpec with specified ID does not exist",
+    LLRPStatusCode.M_NoSuchAccessSpec: "AccessSpec with specified ID does not exist",
+    LLRPStatusCode.M_ROSpecCurrentlyDisabled: "ROSpec is currently disabled",
+    LLRPStatusCode.M_ROSpecCurrentlyEnabled: "ROSpec is currently enabled",
+    LLRPStatusCode.M_NoMoreROSpecs: "Maximum number of ROSpecs reached",
+    LLRPStatusCode.M_NoMoreAccessSpecs: "Maximum number of AccessSpecs reached",
+    LLRPStatusCode.M_AccessSpecCurrentlyDisabled: "AccessSpec is currently disabled",
+    LLRPStatusCode.M_AccessSpecCurrentlyEnabled: "AccessSpec is currently enabled",
+    LLRPStatusCode.M_ROSpecNotConfigured: "ROSpec configuration incomplete",
+    LLRPStatusCode.M_AccessSpecNotConfigured: "AccessSpec configuration incomplete",
     
-    return descriptions.get(status_code, f"Unknown error code: {status_code}")
+    # Device Errors
+    LLRPStatusCode.M_DeviceError: "General device error",
+    LLRPStatusCode.M_OutOfRange: "Requested value out of supported range",
+    LLRPStatusCode.M_NoAntennaConnected: "No antenna connected to specified port",
+    LLRPStatusCode.M_ReaderTemperatureTooHigh: "Reader temperature exceeds safe operating limit",
+    LLRPStatusCode.M_ReaderOverheated: "Reader has overheated and shut down",
+    LLRPStatusCode.M_ReaderInitializationFailure: "Reader failed to initialize properly",
+    
+    # Air Protocol Errors
+    LLRPStatusCode.M_InvalidFrequency: "Specified frequency not supported",
+    LLRPStatusCode.M_InvalidAntennaID: "Invalid antenna ID specified",
+    LLRPStatusCode.M_InvalidPowerLevel: "Power level out of supported range",
+    LLRPStatusCode.M_CycleCountExceeded: "Maximum cycle count exceeded",
+    LLRPStatusCode.M_InvalidParameter: "Parameter value invalid for current configuration",
+    
+    # Other Errors
+    LLRPStatusCode.M_Other: "Other error not specified above",
+    LLRPStatusCode.A_Invalid: "Invalid parameter value",
+    LLRPStatusCode.A_OutOfRange: "Parameter value out of range",
+}
+
+
+
+def get_error_description(status_code: int) -> str:
+    """Get human-readable description for LLRP status code"""
+    return _ERROR_DESCRIPTIONS.get(status_code, f"Unknown error code: {status_code}")
 
 
 def create_llrp_exception(status_code: int, description: str = "") -> LLRPError:
@@ -187,29 +203,29 @@ def create_llrp_exception(status_code: int, description: str = "") -> LLRPError:
 
 def is_success(status_code: int) -> bool:
     """Check if status code indicates success"""
-    return status_code == LLRPStatusCode.M_Success
+    return status_code == _M_SUCCESS
 
 
 def is_error(status_code: int) -> bool:
     """Check if status code indicates an error"""
-    return status_code != LLRPStatusCode.M_Success
+    return status_code != _M_SUCCESS
 
 
 def log_llrp_status(status_code: int, description: str = "", level: int = logging.INFO):
     """Log LLRP status with appropriate level"""
     
-    if is_success(status_code):
-        logger.info(f"LLRP Success: {description or 'Operation completed'}")
+    if status_code == _M_SUCCESS:
+        logger.info("LLRP Success: %s", description or 'Operation completed')
     else:
-        status_name = getattr(LLRPStatusCode(status_code), 'name', f'Code{status_code}')
+        status_name = _STATUS_NAMES.get(status_code) or f'Code{status_code}'
         error_desc = description or get_error_description(status_code)
         
         if 300 <= status_code <= 399:  # Device errors are more serious
-            logger.error(f"LLRP Device Error {status_code} ({status_name}): {error_desc}")
+            logger.error("LLRP Device Error %d (%s): %s", status_code, status_name, error_desc)
         elif 200 <= status_code <= 299:  # ROSpec errors
-            logger.warning(f"LLRP ROSpec Error {status_code} ({status_name}): {error_desc}")
+            logger.warning("LLRP ROSpec Error %d (%s): %s", status_code, status_name, error_desc)
         else:  # Parameter and other errors
-            logger.warning(f"LLRP Error {status_code} ({status_name}): {error_desc}")
+            logger.warning("LLRP Error %d (%s): %s", status_code, status_name, error_desc)
 
 
 # Quick reference for common operations
@@ -228,9 +244,13 @@ def check_llrp_response(status_code: int, description: str = "", raise_on_error:
     Raises:
         LLRPError: If status indicates error and raise_on_error=True
     """
+    if status_code == _M_SUCCESS:
+        logger.info("LLRP Success: %s", description or 'Operation completed')
+        return True
+    
     log_llrp_status(status_code, description)
     
-    if is_error(status_code) and raise_on_error:
+    if raise_on_error:
         raise create_llrp_exception(status_code, description)
     
-    return is_success(status_code)
\ No newline at end of file
+    return False
\ No newline at end of file
@@ -518,6 +518,32 @@ class GetROSpecResponse(LLRPMessage):
 
 # Tag Report Messages  
 
+# Parameter TLV header: type(2) + length(2)
+_PARAM_HEADER = struct.Struct('!HH')
+
+# Plain-int copies of the parameter types compared once per report;
+# IntEnum member lookup costs several times an int comparison
+_PT_TAG_REPORT_DATA = int(ParameterType.TAG_REPORT_DATA)
+_PT_RF_SURVEY_REPORT_DATA = int(ParameterType.RF_SURVEY_REPORT_DATA)
+
+# Fixed-size TV fields of TagReportData, decoded in place:
+# TV type -> (TagReportData attribute, value codec at offset 1)
+_TAG_REPORT_TV_FIELDS = {
+    ParameterType.ROSPEC_ID: ('rospec_id', struct.Struct('!I')),
+    ParameterType.SPEC_INDEX: ('spec_index', struct.Struct('!H')),
+    ParameterType.INVENTORY_PARAMETER_SPEC_ID: ('inventory_parameter_spec_id', struct.Struct('!H')),
+    ParameterType.ANTENNA_ID: ('antenna_id', struct.Struct('!H')),
+    ParameterType.PEAK_RSSI: ('peak_rssi', struct.Struct('!b')),
+    ParameterType.CHANNEL_INDEX: ('channel_index', struct.Struct('!H')),
+    ParameterType.FIRST_SEEN_TIMESTAMP_UTC: ('first_seen_timestamp_utc', struct.Struct('!Q')),
+    ParameterType.FIRST_SEEN_TIMESTAMP_UPTIME: ('first_seen_timestamp_uptime', struct.Struct('!Q')),
+    ParameterType.LAST_SEEN_TIMESTAMP_UTC: ('last_seen_timestamp_utc', struct.Struct('!Q')),
+    ParameterType.LAST_SEEN_TIMESTAMP_UPTIME: ('last_seen_timestamp_uptime', struct.Struct('!Q')),
+    ParameterType.TAG_SEEN_COUNT: ('tag_seen_count', struct.Struct('!H')),
+    ParameterType.ACCESS_SPEC_ID: ('access_spec_id', struct.Struct('!I')),
+}
+
+
 @dataclass  
 class TagReportData(LLRPParameter):
     """Tag Report Data Parameter - Complete Implementation"""
@@ -551,7 +577,7 @@ class TagReportData(LLRPParameter):
             
         # Parse TagReportData header
         param_type, total_length, header_len, is_tv = LLRPParameter.parse_header(data)
-        if param_type != ParameterType.TAG_REPORT_DATA:
+        if param_type != _PT_TAG_REPORT_DATA:
             return 0
             
         offset = header_len  # Start after TagReportData header
@@ -569,6 +595,14 @@ class TagReportData(LLRPParameter):
                 print(f"Warning: Parameter {sub_param_type} extends beyond bounds, skipping")
                 break
             
+            # Fixed-size TV fields: read the value straight into the attribute
+            tv_field = _TAG_REPORT_TV_FIELDS.get(sub_param_type) if sub_is_tv else None
+            if tv_field is not None:
+                attr, codec = tv_field
+                setattr(self, attr, codec.unpack_from(data, offset + 1)[0])
+                offset += sub_param_length
+                continue
+            
             # Extract parameter data
             param_data = data[offset:offset+sub_param_length]
             
@@ -662,7 +696,7 @@ class RFSurveyReportData(LLRPParameter):
             
         # Parse header
         param_type, total_length, header_len, is_tv = LLRPParameter.parse_header(data)
-        if param_type != ParameterType.RF_SURVEY_REPORT_DATA:
+        if param_type != _PT_RF_SURVEY_REPORT_DATA:
             return 0
             
         offset = header_len  # Start after header
@@ -716,8 +750,8 @@ class ROAccessReport(LLRPMessage):
                 if offset + 4 > len(data):
                     break
                 
-                # Read parameter header
-                first_word = struct.unpack('!H', data[offset:offset+2])[0]
+                # Read parameter header in place
+                first_word, param_len = _PARAM_HEADER.unpack_from(data, offset)
                 
                 # Check if TV or TLV parameter
                 if first_word & 0x8000:  # TV parameter
@@ -726,9 +760,6 @@ class ROAccessReport(LLRPMessage):
                     param_len = 4  # Default, adjust as needed
                 else:  # TLV parameter
                     param_type = first_word & 0x3FF
-                    if offset + 4 > len(data):
-                        break
-                    param_len = struct.unpack('!H', data[offset+2:offset+4])[0]
                 
                 # Validate parameter length
                 if param_len < 4 or offset + param_len > len(data):
@@ -737,7 +768,7 @@ class ROAccessReport(LLRPMessage):
                     continue
                 
                 # Parse TagReportData parameters
-                if param_type == ParameterType.TAG_REPORT_DATA:
+                if param_type == _PT_TAG_REPORT_DATA:
                     tag_data = TagReportData()
                     consumed = tag_data.decode(data[offset:offset+param_len])
                     if consumed > 0:
@@ -746,7 +777,7 @@ class ROAccessReport(LLRPMessage):
                     else:
                         offset += param_len
                 # Parse RFSurveyReportData parameters
-                elif param_type == ParameterType.RF_SURVEY_REPORT_DATA:
+                elif param_type == _PT_RF_SURVEY_REPORT_DATA:
                     rf_survey_data = RFSurveyReportData()
                     consumed = rf_survey_data.decode(data[offset:offset+param_len])
                     if consumed > 0:
@@ -782,6 +813,27 @@ class ROAccessReport(LLRPMessage):
                 epcs.add(epc)
         return list(epcs)
     
+    def get_tag_columns(self) -> dict:
+        """Get tag reports as parallel columns, one list per field
+        
+        Built in a single pass; suitable for handing to analytics code
+        that wants column-oriented data (e.g. a DataFrame constructor).
+        """
+        epc, antenna_id, peak_rssi, tag_seen_count, rospec_id = [], [], [], [], []
+        for tag in self.tag_report_data:
+            epc.append(tag.get_epc_hex())
+            antenna_id.append(tag.antenna_id)
+            peak_rssi.append(tag.peak_rssi)
+            tag_seen_count.append(tag.tag_seen_count)
+            rospec_id.append(tag.rospec_id)
+        return {
+            'epc': epc,
+            'antenna_id': antenna_id,
+            'peak_rssi': peak_rssi,
+            'tag_seen_count': tag_seen_count,
+            'rospec_id': rospec_id,
+        }
+    
     def get_tags_by_antenna(self, antenna_id: int) -> List[TagReportData]:
         """Get tag reports from specific antenna"""
         return [tag for tag in self.tag_report_data 
@@ -7,6 +7,15 @@ from typing import Optional
 from dataclasses import dataclass
 from .protocol import LLRPParameter, ParameterType
 
+# Field codecs, compiled once and shared by every parameter instance
+_I8 = struct.Struct('!b')
+_U16 = struct.Struct('!H')
+_U32 = struct.Struct('!I')
+_U64 = struct.Struct('!Q')
+
+# Plain-int copy of the type checked on every EPCData decode
+_PT_EPC_DATA = int(ParameterType.EPC_DATA)
+
 
 @dataclass
 class EPCData(LLRPParameter):
@@ -20,11 +29,10 @@ class EPCData(LLRPParameter):
         """Encode EPCData parameter"""
         # EPC length in bits (2 bytes) + EPC data
         epc_bit_count = len(self.epc) * 8
-        payload = struct.pack('!H', epc_bit_count) + self.epc
+        payload = _U16.pack(epc_bit_count) + self.epc
         
         # Add padding to 4-byte boundary (LLRP requirement)
-        while len(payload) % 4 != 0:
-            payload += b'\x00'
+        payload += b'\x00' * (-len(payload) % 4)
         
         # TLV encoding: 4-byte header + payload
         total_length = 4 + len(payload)
@@ -38,11 +46,11 @@ class EPCData(LLRPParameter):
             
         # Parse header to get total length
         param_type, param_length, header_len, is_tv = LLRPParameter.parse_header(data)
-        if param_type != ParameterType.EPC_DATA:
+        if param_type != _PT_EPC_DATA:
             return 0
             
         # Read EPC bit count (after header)
-        epc_bit_count = struct.unpack('!H', data[header_len:header_len+2])[0]
+        epc_bit_count = _U16.unpack_from(data, header_len)[0]
         epc_byte_count = (epc_bit_count + 7) // 8  # Round up to bytes
         
         # Extract EPC data
@@ -69,24 +77,15 @@ class EPC96(LLRPParameter):
         # TV encoding: 1 byte header + 12 bytes data (96 bits)
         header = self.encode_header(13)
         
-        # Convert 96-bit integer to 12 bytes
-        data = b''
-        temp_epc = self.epc
-        for i in range(12):
-            data = bytes([(temp_epc >> (8 * (11 - i))) & 0xFF]) + data
-        
-        return header + data
+        # Convert 96-bit integer to 12 bytes, most significant first
+        return header + self.epc.to_bytes(12, 'big')
     
     def decode(self, data: bytes) -> int:
         """Decode EPC-96 parameter"""
         # TV parameter: data starts right after 1-byte header
         if len(data) >= 13:
-            epc_bytes = data[1:13]  # 12 bytes for 96 bits
-            
-            # Convert to integer
-            self.epc = 0
-            for byte in epc_bytes:
-                self.epc = (self.epc << 8) | byte
+            # 12 bytes for 96 bits
+            self.epc = int.from_bytes(data[1:13], 'big')
                 
         return 13
     
@@ -106,13 +105,13 @@ class ROSpecID(LLRPParameter):
     def encode(self) -> bytes:
         # TV encoding: 1 byte header + 4 bytes data
         header = self.encode_header(5)
-        data = struct.pack('!I', self.rospec_id)
+        data = _U32.pack(self.rospec_id)
         return header + data
     
     def decode(self, data: bytes) -> int:
         # TV parameter: data starts right after 1-byte header
         if len(data) >= 5:
-            self.rospec_id = struct.unpack('!I', data[1:5])[0]
+            self.rospec_id = _U32.unpack_from(data, 1)[0]
         return 5
 
 
@@ -127,13 +126,13 @@ class SpecIndex(LLRPParameter):
     def encode(self) -> bytes:
         # TV encoding: 1 byte header + 2 bytes data
         header = self.encode_header(3)
-        data = struct.pack('!H', self.spec_index)
+        data = _U16.pack(self.spec_index)
         return header + data
     
     def decode(self, data: bytes) -> int:
         # TV parameter: data starts right after 1-byte header
         if len(data) >= 3:
-            self.spec_index = struct.unpack('!H', data[1:3])[0]
+            self.spec_index = _U16.unpack_from(data, 1)[0]
         return 3
 
 
@@ -147,11 +146,11 @@ class InventoryParameterSpecID(LLRPParameter):
     
     def encode(self) -> bytes:
         header = self.encode_header(6)
-        data = struct.pack('!H', self.spec_id)
+        data = _U16.pack(self.spec_id)
         return header + data
     
     def decode(self, data: bytes) -> int:
-        self.spec_id = struct.unpack('!H', data[4:6])[0]
+        self.spec_id = _U16.unpack_from(data, 4)[0]
         return 6
 
 
@@ -166,13 +165,13 @@ class AntennaID(LLRPParameter):
     def encode(self) -> bytes:
         # TV encoding: 1 byte header + 2 bytes data
         header = self.encode_header(3)
-        data = struct.pack('!H', self.antenna_id)
+        data = _U16.pack(self.antenna_id)
         return header + data
     
     def decode(self, data: bytes) -> int:
         # TV parameter: data starts right after 1-byte header
         if len(data) >= 3:
-            self.antenna_id = struct.unpack('!H', data[1:3])[0]
+            self.antenna_id = _U16.unpack_from(data, 1)[0]
         return 3
 
 
@@ -187,13 +186,13 @@ class PeakRSSI(LLRPParameter):
     def encode(self) -> bytes:
         # TV encoding: 1 byte header + 1 byte data
         header = self.encode_header(2)
-        data = struct.pack('!b', self.rssi)  # signed byte
+        data = _I8.pack(self.rssi)  # signed byte
         return header + data
     
     def decode(self, data: bytes) -> int:
         # TV parameter: data starts right after 1-byte header
         if len(data) >= 2:
-            self.rssi = struct.unpack('!b', data[1:2])[0]
+            self.rssi = _I8.unpack_from(data, 1)[0]
         return 2
 
 
@@ -208,13 +207,13 @@ class ChannelIndex(LLRPParameter):
     def encode(self) -> bytes:
         # TV encoding: 1 byte header + 2 bytes data
         header = self.encode_header(3)
-        data = struct.pack('!H', self.channel_index)
+        data = _U16.pack(self.channel_index)
         return header + data
     
     def decode(self, data: bytes) -> int:
         # TV parameter: data starts right after 1-byte header
         if len(data) >= 3:
-            self.channel_index = struct.unpack('!H', data[1:3])[0]
+            self.channel_index = _U16.unpack_from(data, 1)[0]
         return 3
 
 
@@ -229,13 +228,13 @@ class FirstSeenTimestampUTC(LLRPParameter):
     def encode(self) -> bytes:
         # TV encoding: 1 byte header + 8 bytes data
         header = self.encode_header(9)
-        data = struct.pack('!Q', self.microseconds)
+        data = _U64.pack(self.microseconds)
         return header + data
     
     def decode(self, data: bytes) -> int:
         # TV parameter: data starts right after 1-byte header
         if len(data) >= 9:
-            self.microseconds = struct.unpack('!Q', data[1:9])[0]
+            self.microseconds = _U64.unpack_from(data, 1)[0]
         return 9
 
 
@@ -250,13 +249,13 @@ class FirstSeenTimestampUptime(LLRPParameter):
     def encode(self) -> bytes:
         # TV encoding: 1 byte header + 8 bytes data
         header = self.encode_header(9)
-        data = struct.pack('!Q', self.microseconds)
+        data = _U64.pack(self.microseconds)
         return header + data
     
     def decode(self, data: bytes) -> int:
         # TV parameter: data starts right after 1-byte header
         if len(data) >= 9:
-            self.microseconds = struct.unpack('!Q', data[1:9])[0]
+            self.microseconds = _U64.unpack_from(data, 1)[0]
         return 9
 
 
@@ -271,13 +270,13 @@ class LastSeenTimestampUTC(LLRPParameter):
     def encode(self) -> bytes:
         # TV encoding: 1 byte header + 8 bytes data
         header = self.encode_header(9)
-        data = struct.pack('!Q', self.microseconds)
+        data = _U64.pack(self.microseconds)
         return header + data
     
     def decode(self, data: bytes) -> int:
         # TV parameter: data starts right after 1-byte header
         if len(data) >= 9:
-            self.microseconds = struct.unpack('!Q', data[1:9])[0]
+            self.microseconds = _U64.unpack_from(data, 1)[0]
         return 9
 
 
@@ -292,13 +291,13 @@ class LastSeenTimestampUptime(LLRPParameter):
     def encode(self) -> bytes:
         # TV encoding: 1 byte header + 8 bytes data
         header = self.encode_header(9)
-        data = struct.pack('!Q', self.microseconds)
+        data = _U64.pack(self.microseconds)
         return header + data
     
     def decode(self, data: bytes) -> int:
         # TV parameter: data starts right after 1-byte header
         if len(data) >= 9:
-            self.microseconds = struct.unpack('!Q', data[1:9])[0]
+            self.microseconds = _U64.unpack_from(data, 1)[0]
         return 9
 
 
@@ -313,13 +312,13 @@ class TagSeenCount(LLRPParameter):
     def encode(self) -> bytes:
         # TV encoding: 1 byte header + 2 bytes data
         header = self.encode_header(3)
-        data = struct.pack('!H', self.tag_count)
+        data = _U16.pack(self.tag_count)
         return header + data
     
     def decode(self, data: bytes) -> int:
         # TV parameter: data starts right after 1-byte header
         if len(data) >= 3:
-            self.tag_count = struct.unpack('!H', data[1:3])[0]
+            self.tag_count = _U16.unpack_from(data, 1)[0]
         return 3
 
 
@@ -334,13 +333,13 @@ class AccessSpecID(LLRPParameter):
     def encode(self) -> bytes:
         # TV encoding: 1 byte header + 4 bytes data
         header = self.encode_header(5)
-        data = struct.pack('!I', self.access_spec_id)
+        data = _U32.pack(self.access_spec_id)
         return header + data
     
     def decode(self, data: bytes) -> int:
         # TV parameter: data starts right after 1-byte header
         if len(data) >= 5:
-            self.access_spec_id = struct.unpack('!I', data[1:5])[0]
+            self.access_spec_id = _U32.unpack_from(data, 1)[0]
         return 5
 
 
@@ -14,6 +14,54 @@ from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
 
+# Message header: 3 bits reserved + 3 bits version + 10 bits type, length, ID
+_MSG_HEADER = struct.Struct('!HII')
+
+# Parameter TLV header: 6 bits reserved + 10 bits type, 16 bits length
+_TLV_HEADER = struct.Struct('!HH')
+
+# LLRPStatus fields: status code, error description length
+_STATUS_FIELDS = struct.Struct('!HH')
+
+# TV parameter types from LLRP specification
+_TV_PARAMETER_TYPES = frozenset({
+    1,   # AntennaID
+    2,   # FirstSeenTimestampUTC
+    3,   # FirstSeenTimestampUptime
+    4,   # LastSeenTimestampUTC
+    5,   # LastSeenTimestampUptime
+    6,   # PeakRSSI
+    7,   # ChannelIndex
+    8,   # TagSeenCount
+    9,   # ROSpecID
+    10,  # InventoryParameterSpecID
+    11,  # C1G2CRC
+    12,  # C1G2PC
+    13,  # EPC-96
+    14,  # SpecIndex
+    15,  # ClientRequestOpSpecResult
+    16,  # AccessSpecID
+    17,  # C1G2SingulationDetails
+    18,  # C1G2WriteMode
+})
+
+# TV parameter lengths are fixed based on type
+_TV_PARAMETER_LENGTHS = {
+    1: 3,   # AntennaID: 1 header + 2 data
+    2: 9,   # FirstSeenTimestampUTC: 1 header + 8 data
+    3: 9,   # FirstSeenTimestampUptime: 1 header + 8 data
+    4: 9,   # LastSeenTimestampUTC: 1 header + 8 data
+    5: 9,   # LastSeenTimestampUptime: 1 header + 8 data
+    6: 2,   # PeakRSSI: 1 header + 1 data
+    7: 3,   # ChannelIndex: 1 header + 2 data
+    8: 3,   # TagSeenCount: 1 header + 2 data
+    9: 5,   # ROSpecID: 1 header + 4 data
+    10: 3,  # InventoryParameterSpecID: 1 header + 2 data
+    13: 13, # EPC-96: 1 header + 12 data
+    14: 3,  # SpecIndex: 1 header + 2 data
+    16: 5,  # AccessSpecID: 1 header + 4 data
+}
+
 
 # LLRP Message Types
 class MessageType(IntEnum):
@@ -148,19 +196,36 @@ class AirProtocol(IntEnum):
     EPC_GLOBAL_CLASS1_GEN2 = 1
 
 
-@dataclass
 class LLRPHeader:
     """LLRP Message Header (10 bytes)"""
-    version: int = 1
-    message_type: int = 0
-    message_length: int = 10
-    message_id: int = 0
+    
+    # One header per message on the receive path; keep instances small
+    __slots__ = ('version', 'message_type', 'message_length', 'message_id')
+    
+    def __init__(self, version: int = 1, message_type: int = 0,
+                 message_length: int = 10, message_id: int = 0):
+        self.version = version
+        self.message_type = message_type
+        self.message_length = message_length
+        self.message_id = message_id
+    
+    def __repr__(self) -> str:
+        return (f"LLRPHeader(version={self.version!r}, message_type={self.message_type!r}, "
+                f"message_length={self.message_length!r}, message_id={self.message_id!r})")
+    
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.version, self.message_type, self.message_length, self.message_id) == \
+               (other.version, other.message_type, other.message_length, other.message_id)
+    
+    __hash__ = None
     
     def pack(self) -> bytes:
         """Pack header into binary format"""
         # First 16 bits: 3 bits reserved, 3 bits version, 10 bits message type
         first_16 = (self.version << 10) | (self.message_type & 0x3FF)
-        return struct.pack('!HII', first_16, self.message_length, self.message_id)
+        return _MSG_HEADER.pack(first_16, self.message_length, self.message_id)
     
     @classmethod
     def unpack(cls, data: bytes) -> 'LLRPHeader':
@@ -168,7 +233,7 @@ class LLRPHeader:
         if len(data) < 10:
             raise ValueError("Insufficient data for header")
         
-        first_16, length, msg_id = struct.unpack('!HII', data[:10])
+        first_16, length, msg_id = _MSG_HEADER.unpack_from(data)
         version = (first_16 >> 10) & 0x7
         msg_type = first_16 & 0x3FF
         
@@ -185,28 +250,7 @@ class LLRPParameter(ABC):
     
     def _is_tv_parameter(self, param_type: int) -> bool:
         """Determine if parameter uses TV encoding based on LLRP spec"""
-        # TV parameters from LLRP specification
-        tv_parameters = {
-            1,   # AntennaID
-            2,   # FirstSeenTimestampUTC
-            3,   # FirstSeenTimestampUptime
-            4,   # LastSeenTimestampUTC
-            5,   # LastSeenTimestampUptime
-            6,   # PeakRSSI
-            7,   # ChannelIndex
-            8,   # TagSeenCount
-            9,   # ROSpecID
-            10,  # InventoryParameterSpecID
-            11,  # C1G2CRC
-            12,  # C1G2PC
-            13,  # EPC-96
-            14,  # SpecIndex
-            15,  # ClientRequestOpSpecResult
-            16,  # AccessSpecID
-            17,  # C1G2SingulationDetails
-            18,  # C1G2WriteMode
-        }
-        return param_type in tv_parameters
+        return param_type in _TV_PARAMETER_TYPES
     
     @abstractmethod
     def encode(self) -> bytes:
@@ -226,7 +270,7 @@ class LLRPParameter(ABC):
         else:
             # TLV encoding: 6 bits reserved (0), 10 bits type, 16 bits length
             type_field = self.param_type & 0x3FF
-            return struct.pack('!HH', type_field, total_length)
+            return _TLV_HEADER.pack(type_field, total_length)
     
     @staticmethod
     def parse_header(data: bytes, offset: int = 0) -> tuple:
@@ -243,33 +287,16 @@ class LLRPParameter(ABC):
         
         if first_byte & 0x80:  # TV parameter (bit 0 = 1)
             param_type = first_byte & 0x7F
-            # TV parameter lengths are fixed based on type
-            tv_lengths = {
-                1: 3,   # AntennaID: 1 header + 2 data
-                2: 9,   # FirstSeenTimestampUTC: 1 header + 8 data  
-                3: 9,   # FirstSeenTimestampUptime: 1 header + 8 data
-                4: 9,   # LastSeenTimestampUTC: 1 header + 8 data
-                5: 9,   # LastSeenTimestampUptime: 1 header + 8 data
-                6: 2,   # PeakRSSI: 1 header + 1 data
-                7: 3,   # ChannelIndex: 1 header + 2 data
-                8: 3,   # TagSeenCount: 1 header + 2 data
-                9: 5,   # ROSpecID: 1 header + 4 data
-                10: 3,  # InventoryParameterSpecID: 1 header + 2 data
-                13: 13, # EPC-96: 1 header + 12 data
-                14: 3,  # SpecIndex: 1 header + 2 data
-                16: 5,  # AccessSpecID: 1 header + 4 data
-            }
-            param_length = tv_lengths.get(param_type, 2)  # Default minimum
+            param_length = _TV_PARAMETER_LENGTHS.get(param_type, 2)  # Default minimum
             return param_type, param_length, 1, True
             
         else:  # TLV parameter (bit 0 = 0)
             if len(data) < offset + 4:
                 return None, 0, 0, False
                 
-            # Read type and length
-            type_field = struct.unpack('!H', data[offset:offset+2])[0]
+            # Read type and length in place
+            type_field, param_length = _TLV_HEADER.unpack_from(data, offset)
             param_type = type_field & 0x3FF  # Lower 10 bits
-            param_length = struct.unpack('!H', data[offset+2:offset+4])[0]
             
             return param_type, param_length, 4, False
 
@@ -307,11 +334,10 @@ class LLRPStatus(LLRPParameter):
         desc_len = len(desc_bytes)
         
         # Payload: 2 bytes status code + 2 bytes desc length + description
-        payload = struct.pack('!HH', self.status_code, desc_len) + desc_bytes
+        payload = _STATUS_FIELDS.pack(self.status_code, desc_len) + desc_bytes
         
         # Add padding to 4-byte boundary
-        while len(payload) % 4 != 0:
-            payload += b'\x00'
+        payload += b'\x00' * (-len(payload) % 4)
         
         # TLV header + payload
         total_len = 4 + len(payload)
@@ -333,7 +359,7 @@ class LLRPStatus(LLRPParameter):
         if len(data) < payload_start + 4:
             return param_length
             
-        self.status_code, desc_len = struct.unpack('!HH', data[payload_start:payload_start+4])
+        self.status_code, desc_len = _STATUS_FIELDS.unpack_from(data, payload_start)
         
         # Read description if present
         if desc_len > 0 and len(data) >= payload_start + 4 + desc_len:
@@ -346,21 +372,16 @@ class LLRPStatus(LLRPParameter):
     
     def is_success(self) -> bool:
         """Check if status indicates success"""
-        from .errors import is_success
-        return is_success(self.status_code)
+        return self.status_code == 0  # M_Success
     
     def is_error(self) -> bool:
         """Check if status indicates an error"""
-        from .errors import is_error
-        return is_error(self.status_code)
+        return self.status_code != 0  # M_Success
     
     def get_error_name(self) -> str:
         """Get human-readable error name"""
-        from .errors import LLRPStatusCode
-        try:
-            return LLRPStatusCode(self.status_code).name
-        except ValueError:
-            return f"UnknownStatus_{self.status_code}"
+        from .errors import _STATUS_NAMES
+        return _STATUS_NAMES.get(self.status_code) or f"UnknownStatus_{self.status_code}"
     
     def get_error_description(self) -> str:
         """Get complete error description"""
@@ -378,12 +399,13 @@ class LLRPStatus(LLRPParameter):
     
     def to_dict(self) -> dict:
         """Convert to dictionary for logging/debugging"""
+        success = self.status_code == 0  # M_Success
         return {
             'status_code': self.status_code,
             'status_name': self.get_error_name(),
             'error_description': self.get_error_description(),
-            'is_success': self.is_success(),
-            'is_error': self.is_error()
+            'is_success': success,
+            'is_error': not success
         }
 
 
@@ -550,7 +572,11 @@ class LLRPConnection:
             return True
             
         except Exception as e:
-            logger.error(f"Connection failed: {e}")
+            # Expected when probing for a reader; report it and release the socket
+            logger.error("Connection failed: %s", e)
+            if self.socket:
+                self.socket.close()
+                self.socket = None
             return False
     
     def disconnect(self):
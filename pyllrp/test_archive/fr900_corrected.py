@@ -8,7 +8,6 @@ import socket
 import struct
 import time
 import logging
-import binascii
 import threading
 
 logging.basicConfig(level=logging.DEBUG)
@@ -79,7 +78,7 @@ class FR900CorrectedClient:
             
             logger.debug(f"RX: Type=0x{type_field:04X} (0x{msg_type:02X}), Len={msg_len}, ID={msg_id}")
             if data and len(data) <= 100:
-                logger.debug(f"    Data: {binascii.hexlify(data).decode()}")
+                logger.debug(f"    Data: {data.hex()}")
             return msg_type, msg_id, data
             
         except socket.timeout:
@@ -262,7 +261,7 @@ class FR900CorrectedClient:
             else:
                 logger.error(f"ROSpec failed with response: 0x{msg_type:02X}")
             if data:
-                logger.error(f"Response data: {binascii.hexlify(data).decode()}")
+                logger.error(f"Response data: {data.hex()}")
         return False
     
     def start_keepalive(self):
@@ -389,7 +388,7 @@ class FR900CorrectedClient:
             else:
                 logger.error(f"ROSpec failed with response: 0x{msg_type:02X}")
             if data:
-                logger.error(f"Response data: {binascii.hexlify(data).decode()}")
+                logger.error(f"Response data: {data.hex()}")
         return False
 
     def add_rospec_multi_antenna(self):
@@ -493,7 +492,7 @@ class FR900CorrectedClient:
             else:
                 logger.error(f"Multi-antenna ROSpec failed with response: 0x{msg_type:02X}")
             if data:
-                logger.error(f"Response data: {binascii.hexlify(data).decode()}")
+                logger.error(f"Response data: {data.hex()}")
         return False
     
     def add_rospec_selective_antennas(self, antenna_ids):
@@ -562,7 +561,7 @@ class FR900CorrectedClient:
             else:
                 logger.error(f"Selective antenna ROSpec failed with response: 0x{msg_type:02X}")
             if data:
-                logger.error(f"Response data: {binascii.hexlify(data).decode()}")
+                logger.error(f"Response data: {data.hex()}")
         return False
     
     def test_antenna_combinations(self):
@@ -651,7 +650,7 @@ class FR900CorrectedClient:
         struct.pack_into('!H', rospec_data, rospec_start + 2, rospec_len)
         
         logger.info(f"Sending simple ROSpec: {len(rospec_data)} bytes")
-        logger.debug(f"ROSpec hex: {binascii.hexlify(rospec_data).decode()}")
+        logger.debug(f"ROSpec hex: {rospec_data.hex()}")
         
         self.send_message(0x14, bytes(rospec_data))
         
@@ -665,7 +664,7 @@ class FR900CorrectedClient:
             else:
                 logger.error(f"ROSpec failed with response: 0x{msg_type:02X}")
             if data:
-                logger.error(f"Response data: {binascii.hexlify(data).decode()}")
+                logger.error(f"Response data: {data.hex()}")
         return False
     
     def enable_rospec(self, rospec_id=0x04D2):
@@ -708,13 +707,13 @@ class FR900CorrectedClient:
         """Read tags for specified duration"""
         logger.info(f"Reading tags for {duration} seconds...")
         
-        end_time = time.time() + duration
+        end_time = time.monotonic() + duration
         tag_count = 0
         unique_epcs = set()
         
         self.socket.settimeout(0.5)
         
-        while time.time() < end_time:
+        while time.monotonic() < end_time:
             msg_type, msg_id, data = self.recv_message()
             
             if msg_type is None:
@@ -732,7 +731,7 @@ class FR900CorrectedClient:
                                 epc_len = struct.unpack('!H', data[i+2:i+4])[0] - 4
                                 if 8 <= epc_len <= 16:
                                     epc = data[i+4:i+4+epc_len]
-                                    epc_hex = binascii.hexlify(epc).decode().upper()
+                                    epc_hex = epc.hex().upper()
                                     unique_epcs.add(epc_hex)
                                     logger.info(f"  Tag #{tag_count}: EPC={epc_hex}")
                                     break
@@ -8,7 +8,6 @@ import socket
 import struct
 import time
 import logging
-import binascii
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -57,7 +56,7 @@ class FR900FixedClient:
         
         logger.debug(f"TX: Type=0x{type_field:04X}, Len={length}, ID={msg_id}")
         if len(msg_data) <= 50:
-            logger.debug(f"    Data: {binascii.hexlify(message).decode()}")
+            logger.debug(f"    Data: {message.hex()}")
         
         self.socket.send(message)
         return msg_id
@@ -252,13 +251,13 @@ class FR900FixedClient:
         """Read tags and parse EPC data"""
         logger.info(f"Reading tags for {duration} seconds...")
         
-        end_time = time.time() + duration
+        end_time = time.monotonic() + duration
         tag_count = 0
         unique_epcs = set()
         
         self.socket.settimeout(0.5)
         
-        while time.time() < end_time:
+        while time.monotonic() < end_time:
             msg_type, msg_id, data = self.recv_message()
             
             if msg_type is None:
@@ -276,7 +275,7 @@ class FR900FixedClient:
                                 epc_len = struct.unpack('!H', data[i+2:i+4])[0] - 4
                                 if 8 <= epc_len <= 16:
                                     epc = data[i+4:i+4+epc_len]
-                                    epc_hex = binascii.hexlify(epc).decode().upper()
+                                    epc_hex = epc.hex().upper()
                                     unique_epcs.add(epc_hex)
                                     logger.info(f"  Tag #{tag_count}: EPC={epc_hex}")
                                     break
@@ -8,7 +8,6 @@ import socket
 import struct
 import time
 import logging
-import binascii
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -164,9 +163,9 @@ class FR900MinimalClient:
                     # Read for a short time
                     self.socket.settimeout(0.5)
                     tag_count = 0
-                    start_time = time.time()
+                    deadline = time.monotonic() + 3
                     
-                    while time.time() - start_time < 3:
+                    while time.monotonic() < deadline:
                         msg_type, msg_id, data = self.recv_message()
                         if msg_type == 0x3D:  # RO_ACCESS_REPORT
                             tag_count += 1
@@ -4,70 +4,16 @@ FR900 Standard LLRP Test
 Testing with only absolutely required parameters
 """
 
-import socket
 import struct
-import time
 import logging
 
+from llrp_base_client import LLRPBaseClient
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class FR900StandardTest:
-    def __init__(self, host, port=5084):
-        self.host = host
-        self.port = port
-        self.socket = None
-        self.message_id = 1000
-        
-    def connect(self):
-        try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(10.0)
-            self.socket.connect((self.host, self.port))
-            logger.info(f"Connected to {self.host}:{self.port}")
-            
-            # Read initial event
-            msg_type, msg_id, data = self.recv_message()
-            logger.info(f"Initial message: Type=0x{msg_type:02X}")
-            return True
-        except Exception as e:
-            logger.error(f"Connection failed: {e}")
-            return False
-    
-    def send_message(self, msg_type, msg_data=b''):
-        msg_id = self.message_id
-        self.message_id += 1
-        
-        type_field = 0x0400 | msg_type
-        length = 10 + len(msg_data)
-        
-        header = struct.pack('!HII', type_field, length, msg_id)
-        message = header + msg_data
-        
-        self.socket.send(message)
-        logger.debug(f"Sent: Type=0x{msg_type:02X}, ID={msg_id}")
-        return msg_id
-    
-    def recv_message(self):
-        try:
-            header = self.socket.recv(10)
-            if len(header) < 10:
-                logger.error("Short header received")
-                return None, None, None
-            
-            type_field, msg_len, msg_id = struct.unpack('!HII', header)
-            msg_type = type_field & 0xFF
-            
-            remaining = msg_len - 10
-            data = b''
-            if remaining > 0:
-                data = self.socket.recv(remaining)
-            
-            return msg_type, msg_id, data
-            
-        except Exception as e:
-            logger.error(f"Receive error: {e}")
-            return None, None, None
+class FR900StandardTest(LLRPBaseClient):
+    FIRST_MESSAGE_ID = 1000
     
     def test_sequence(self):
         """Test standard LLRP sequence step by step"""
@@ -144,16 +90,6 @@ class FR900StandardTest:
         except Exception as e:
             logger.error(f"Test sequence failed: {e}")
             return False
-    
-    def disconnect(self):
-        if self.socket:
-            try:
-                self.send_message(0x0E, b'')
-                self.recv_message()
-            except:
-                pass
-            self.socket.close()
-            logger.info("Disconnected")
 
 def main():
     READER_IP = "192.168.10.106"
@@ -4,105 +4,69 @@ Bluebird FR900 LLRP Test
 Based on actual packet capture analysis
 """
 
-import socket
 import struct
 import time
 import logging
-import binascii
+
+from llrp_base_client import LLRPBaseClient
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class FR900Client:
-    """Bluebird FR900 LLRP Client"""
-    
-    def __init__(self, host, port=5084):
-        self.host = host
-        self.port = port
-        self.socket = None
-        self.message_id = 1
-        
-    def connect(self):
-        """Connect to FR900 reader"""
-        try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(10.0)
-            self.socket.connect((self.host, self.port))
-            logger.info(f"✓ Connected to {self.host}:{self.port}")
-            
-            # Read initial Reader Event Notification
-            msg_type, msg_id, data = self.recv_message()
-            if msg_type == 0x3F:  # READER_EVENT_NOTIFICATION
-                logger.info("✓ Received Reader Event Notification")
-            return True
-        except Exception as e:
-            logger.error(f"Connection failed: {e}")
-            return False
-    
-    def send_message(self, msg_type, msg_data=b''):
-        """Send LLRP message in FR900 format"""
-        msg_id = self.message_id
-        self.message_id += 1
-        
-        # FR900 uses 0x04 prefix for message type
-        type_field = 0x0400 | msg_type
-        length = 10 + len(msg_data)
-        
-        header = struct.pack('!HII', type_field, length, msg_id)
-        message = header + msg_data
-        
-        logger.debug(f"TX: Type=0x{type_field:04X}, Len={length}, ID={msg_id}")
-        logger.debug(f"    Hex: {binascii.hexlify(message).decode()}")
-        
-        self.socket.send(message)
-        return msg_id
+# Parameter TLV header: type(2) + length(2)
+_TLV = struct.Struct('!HH')
+
+
+def _find_epc(buf, pos, end):
+    """Locate the EPC of the first TagReportData in buf[pos:end]
     
-    def recv_message(self):
-        """Receive LLRP message in FR900 format"""
-        try:
-            # Read 10-byte header
-            header = self.socket.recv(10)
-            if len(header) < 10:
-                logger.error(f"Short header: {len(header)} bytes")
-                return None, None, None
-            
-            # Parse header
-            type_field, msg_len, msg_id = struct.unpack('!HII', header)
-            
-            # Extract actual message type (lower byte)
-            msg_type = type_field & 0xFF
-            
-            # Read message body
-            remaining = msg_len - 10
-            if remaining > 0:
-                data = b''
-                while len(data) < remaining:
-                    chunk = self.socket.recv(remaining - len(data))
-                    if not chunk:
-                        break
-                    data += chunk
-            else:
-                data = b''
-            
-            logger.debug(f"RX: Type=0x{type_field:04X} (0x{msg_type:02X}), Len={msg_len}, ID={msg_id}")
-            if data and len(data) <= 100:
-                logger.debug(f"    Data: {binascii.hexlify(data).decode()}")
+    Works in place on the receive buffer and returns (offset, length),
+    or (-1, 0) if the report carries no EPC.
+    """
+    while pos + 4 <= end:
+        param_type, param_len = _TLV.unpack_from(buf, pos)
+        if param_len < 4:
+            break
+        
+        # TagReportData (Type=240): the EPC is its first sub-parameter
+        if param_type & 0x3FF == 240:
+            sub = pos + 4
+            if sub >= end:
+                break
             
-            return msg_type, msg_id, data
+            # EPC-96 (TV, Type=13)
+            if buf[sub] & 0x80:
+                if buf[sub] & 0x7F == 13 and sub + 13 <= end:
+                    return sub + 1, 12
+                break
             
-        except socket.timeout:
-            return None, None, None
-        except Exception as e:
-            logger.error(f"Receive error: {e}")
-            return None, None, None
+            # EPCData (TLV, Type=241): EPCLengthBits(2) + EPC
+            if sub + 6 <= end:
+                sub_type, sub_len = _TLV.unpack_from(buf, sub)
+                if sub_type & 0x3FF == 241 and sub + sub_len <= end:
+                    return sub + 6, sub_len - 6
+            break
+        
+        pos += param_len
+    return -1, 0
+
+class FR900Client(LLRPBaseClient):
+    """Bluebird FR900 LLRP Client"""
+    
+    FIXED_COMMANDS = {
+        **LLRPBaseClient.FIXED_COMMANDS,
+        'get_capabilities': (0x01, struct.pack('!B', 0)),   # RequestedData: 0 = All
+        'delete_all_rospecs': (0x15, struct.pack('!I', 0)), # ROSpecID: 0 = Delete all
+        'enable_rospec': (0x18, struct.pack('!I', 1)),
+        'start_rospec': (0x16, struct.pack('!I', 1)),
+        'stop_rospec': (0x17, struct.pack('!I', 1)),
+    }
     
     def get_capabilities(self):
         """Send GET_READER_CAPABILITIES"""
         logger.info("Getting reader capabilities...")
         
-        # RequestedData: 0 = All capabilities
-        data = struct.pack('!B', 0)
-        self.send_message(0x01, data)
+        self._send_fixed('get_capabilities')
         
         # Receive response
         msg_type, msg_id, data = self.recv_message()
@@ -138,25 +102,22 @@ class FR900Client:
         header = struct.pack('!HII', type_field, length, msg_id)
         message = header + data
         
-        logger.debug(f"TX Custom: {binascii.hexlify(message).decode()}")
-        self.socket.send(message)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("TX Custom: %s", message.hex())
+        self.socket.sendall(message)
         
         # Receive response
-        header = self.socket.recv(10)
-        if len(header) == 10:
-            type_field, msg_len, resp_id = struct.unpack('!HII', header)
+        msg_type, resp_id, data = self.recv_message()
+        if data:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("RX Custom: %s", data.hex())
             
-            remaining = msg_len - 10
-            if remaining > 0:
-                data = self.socket.recv(remaining)
-                logger.debug(f"RX Custom: {binascii.hexlify(header + data).decode()}")
-                
-                # Parse vendor ID
-                if len(data) >= 4:
-                    vendor_id = struct.unpack('!I', data[:4])[0]
-                    if vendor_id == 0x5E95:
-                        logger.info("✓ Received Bluebird custom response")
-                        return True
+            # Parse vendor ID
+            if len(data) >= 4:
+                vendor_id = struct.unpack('!I', data[:4])[0]
+                if vendor_id == 0x5E95:
+                    logger.info("✓ Received Bluebird custom response")
+                    return True
         return False
     
     def set_reader_config(self):
@@ -177,9 +138,7 @@ class FR900Client:
         """Delete all ROSpecs"""
         logger.info("Deleting all ROSpecs...")
         
-        # ROSpecID: 0 = Delete all
-        data = struct.pack('!I', 0)
-        self.send_message(0x15, data)
+        self._send_fixed('delete_all_rospecs')
         
         msg_type, msg_id, data = self.recv_message()
         if msg_type == 0x1F:  # DELETE_ROSPEC_RESPONSE
@@ -232,8 +191,7 @@ class FR900Client:
         """Enable ROSpec ID 1"""
         logger.info("Enabling ROSpec...")
         
-        data = struct.pack('!I', 1)
-        self.send_message(0x18, data)
+        self._send_fixed('enable_rospec')
         
         msg_type, msg_id, data = self.recv_message()
         if msg_type == 0x22:  # ENABLE_ROSPEC_RESPONSE
@@ -245,8 +203,7 @@ class FR900Client:
         """Start ROSpec ID 1"""
         logger.info("Starting inventory...")
         
-        data = struct.pack('!I', 1)
-        self.send_message(0x16, data)
+        self._send_fixed('start_rospec')
         
         msg_type, msg_id, data = self.recv_message()
         if msg_type == 0x20:  # START_ROSPEC_RESPONSE
@@ -258,8 +215,7 @@ class FR900Client:
         """Stop ROSpec ID 1"""
         logger.info("Stopping inventory...")
         
-        data = struct.pack('!I', 1)
-        self.send_message(0x17, data)
+        self._send_fixed('stop_rospec')
         
         msg_type, msg_id, data = self.recv_message()
         if msg_type == 0x21:  # STOP_ROSPEC_RESPONSE
@@ -271,56 +227,38 @@ class FR900Client:
         """Read tags for specified duration"""
         logger.info(f"Reading tags for {duration} seconds...")
         
-        end_time = time.time() + duration
+        end_time = time.monotonic() + duration
         tag_count = 0
         unique_epcs = set()
         
-        self.socket.settimeout(0.5)
+        buf = self._rx_buf
         
-        while time.time() < end_time:
-            msg_type, msg_id, data = self.recv_message()
-            
-            if msg_type is None:
-                continue
+        def handle(msg_type, msg_id, body_start, body_end):
+            nonlocal tag_count
             
             # RO_ACCESS_REPORT = 0x3D (61)
             if msg_type == 0x3D:
                 tag_count += 1
                 
-                # Try to extract EPC from report
-                if len(data) > 20:
-                    # Simple EPC extraction (look for EPC-96 pattern)
-                    epc_start = data.find(bytes.fromhex('00f1'))
-                    if epc_start >= 0 and len(data) > epc_start + 14:
-                        epc = data[epc_start+4:epc_start+16]
-                        epc_hex = binascii.hexlify(epc).decode()
-                        unique_epcs.add(epc_hex)
-                        logger.info(f"  Tag #{tag_count}: EPC={epc_hex}")
-                    else:
-                        logger.debug(f"  Tag report #{tag_count}")
-                
+                # Walk the report TLVs to the EPC parameter
+                epc_offset, epc_len = _find_epc(buf, body_start, body_end)
+                if epc_len > 0:
+                    # Dedupe on raw EPC bytes; hex only for the log line
+                    epc = bytes(buf[epc_offset:epc_offset+epc_len])
+                    if epc not in unique_epcs:
+                        unique_epcs.add(epc)
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info("  Tag #%d: EPC=%s", tag_count, epc.hex())
+                else:
+                    logger.debug("  Tag report #%d", tag_count)
+            
             # READER_EVENT_NOTIFICATION = 0x3F (63)
             elif msg_type == 0x3F:
                 logger.debug("  Reader event")
         
+        self.read_until(end_time, handle)
+        
         return tag_count, len(unique_epcs)
-    
-    def disconnect(self):
-        """Disconnect from reader"""
-        if self.socket:
-            try:
-                # Send CLOSE_CONNECTION
-                self.send_message(0x0E, b'')
-                
-                # Try to receive response
-                msg_type, msg_id, data = self.recv_message()
-                if msg_type == 0x10:  # CLOSE_CONNECTION_RESPONSE
-                    logger.info("✓ Connection closed properly")
-            except:
-                pass
-            
-            self.socket.close()
-            logger.info("✓ Disconnected")
 
 
 def main():
@@ -344,8 +282,8 @@ def main():
         client.get_capabilities()
         
         # Phase 3: Custom messages (Bluebird specific)
+        # Sent as a pair once, after capabilities, as in the captured handshake
         client.send_custom_message()
-        time.sleep(0.1)
         client.send_custom_message()
         
         # Phase 4: Configure reader
@@ -353,15 +291,10 @@ def main():
         client.delete_all_rospecs()
         
         # Phase 5: Setup and start inventory
-        client.set_reader_config()
         client.add_rospec()
         client.enable_rospec()
         
         # Phase 6: Run inventory
-        client.send_custom_message()
-        client.send_custom_message()
-        
-        client.enable_rospec()
         client.start_rospec()
         
         # Read tags
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Shared raw-socket LLRP client for the standalone FR900 test scripts
+Connection setup, framing and buffered receive live here; the scripts
+subclass it for their reader-specific command sequences
+"""
+
+import socket
+import selectors
+import struct
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# LLRP header: type(2) + length(4) + id(4)
+_LLRP_HDR = struct.Struct('!HII')
+
+# Socket buffer sizes sized for bursts of RO_ACCESS_REPORT messages
+_RCVBUF_SIZE = 1 << 20
+_SNDBUF_SIZE = 1 << 17
+
+
+class LLRPBaseClient:
+    """Minimal LLRP client over a raw TCP socket"""
+
+    # Version bits OR'ed into the message type field (LLRP 1.0.1 = 0x0400)
+    TYPE_PREFIX = 0x0400
+    CONNECT_TIMEOUT = 10.0
+    FIRST_MESSAGE_ID = 1
+
+    # Commands whose body never changes: name -> (msg_type, payload)
+    FIXED_COMMANDS = {
+        'close_connection': (0x0E, b''),
+    }
+
+    def __init__(self, host, port=5084):
+        self.host = host
+        self.port = port
+        self.socket = None
+        self.message_id = self.FIRST_MESSAGE_ID
+
+        # Fully packed frames for fixed commands; only msg_id is rewritten per send
+        self._frames = {}
+        for name, (msg_type, payload) in self.FIXED_COMMANDS.items():
+            frame = bytearray(10 + len(payload))
+            _LLRP_HDR.pack_into(frame, 0, self.TYPE_PREFIX | msg_type, len(frame), 0)
+            frame[10:] = payload
+            self._frames[name] = frame
+
+        # Receive buffer; one recv_into may pull in a burst of several reports
+        self._rx_buf = bytearray(_RCVBUF_SIZE)
+        self._rx_start = 0
+        self._rx_end = 0
+
+    def connect(self):
+        """Connect to reader and consume the initial Reader Event Notification"""
+        try:
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.settimeout(self.CONNECT_TIMEOUT)
+            # Set before connect() so the TCP window scale covers the larger buffer
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RCVBUF_SIZE)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SNDBUF_SIZE)
+            self.socket.connect((self.host, self.port))
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            logger.info(f"Connected to {self.host}:{self.port}")
+
+            msg_type, msg_id, data = self.recv_message()
+            if msg_type == 0x3F:  # READER_EVENT_NOTIFICATION
+                logger.info("Received Reader Event Notification")
+            return True
+        except Exception as e:
+            logger.error(f"Connection failed: {e}")
+            return False
+
+    def send_message(self, msg_type, msg_data=b''):
+        """Send LLRP message"""
+        msg_id = self.message_id
+        self.message_id += 1
+
+        type_field = self.TYPE_PREFIX | msg_type
+        length = 10 + len(msg_data)
+
+        message = _LLRP_HDR.pack(type_field, length, msg_id) + msg_data
+
+        logger.debug("TX: Type=0x%04X, Len=%d, ID=%d", type_field, length, msg_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    Hex: %s", message.hex())
+
+        self.socket.sendall(message)
+        return msg_id
+
+    def _send_fixed(self, name):
+        """Send a precomputed fixed-body command frame"""
+        msg_id = self.message_id
+        self.message_id += 1
+
+        frame = self._frames[name]
+        struct.pack_into('!I', frame, 6, msg_id)
+
+        logger.debug("TX: %s, ID=%d", name, msg_id)
+
+        self.socket.sendall(frame)
+        return msg_id
+
+    def _fill(self):
+        """Read whatever the socket has into the receive buffer"""
+        pending = self._rx_end - self._rx_start
+
+        # Move any partial message to the front, growing the buffer if full
+        if self._rx_start:
+            self._rx_buf[:pending] = self._rx_buf[self._rx_start:self._rx_end]
+            self._rx_start = 0
+            self._rx_end = pending
+        if self._rx_end == len(self._rx_buf):
+            self._rx_buf.extend(bytes(len(self._rx_buf)))
+
+        n = self.socket.recv_into(memoryview(self._rx_buf)[self._rx_end:])
+        if not n:
+            raise ConnectionError("Connection closed by reader")
+        self._rx_end += n
+        return n
+
+    def _pop_span(self):
+        """Take one complete message off the receive buffer without copying it
+
+        Returns (msg_type, msg_id, body_start, body_end) indexing into
+        self._rx_buf, or None. The span stays valid until the next _fill().
+        """
+        start = self._rx_start
+        if self._rx_end - start < 10:
+            return None
+
+        type_field, msg_len, msg_id = _LLRP_HDR.unpack_from(self._rx_buf, start)
+        if msg_len < 10:
+            raise ValueError(f"Invalid message length: {msg_len}")
+        if self._rx_end - start < msg_len:
+            return None
+
+        self._rx_start = start + msg_len
+
+        # Strip the version bits to get the 10-bit message type
+        msg_type = type_field & 0x3FF
+
+        logger.debug("RX: Type=0x%04X (0x%02X), Len=%d, ID=%d", type_field, msg_type, msg_len, msg_id)
+        if 10 < msg_len <= 110 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    Data: %s", self._rx_buf[start+10:start+msg_len].hex())
+
+        return msg_type, msg_id, start + 10, start + msg_len
+
+    def _pop_message(self):
+        """Take one complete message off the receive buffer, or None"""
+        span = self._pop_span()
+        if span is None:
+            return None
+        msg_type, msg_id, body_start, body_end = span
+        # Copy straight out of the buffer; slicing the bytearray would copy twice
+        with memoryview(self._rx_buf) as view:
+            data = bytes(view[body_start:body_end])
+        return msg_type, msg_id, data
+
+    def recv_message(self):
+        """Receive one LLRP message as (msg_type, msg_id, data)"""
+        try:
+            msg = self._pop_message()
+            while msg is None:
+                self._fill()
+                msg = self._pop_message()
+            return msg
+
+        except socket.timeout:
+            return None, None, None
+        except Exception as e:
+            logger.error(f"Receive error: {e}")
+            return None, None, None
+
+    def read_until(self, deadline, handler):
+        """Feed every message received before deadline (time.monotonic) to handler
+
+        handler(msg_type, msg_id, body_start, body_end) is called with a span
+        into self._rx_buf, valid only for the duration of the call.
+        """
+        timeout = self.socket.gettimeout()
+        selector = selectors.DefaultSelector()
+        selector.register(self.socket, selectors.EVENT_READ)
+        self.socket.setblocking(False)
+
+        try:
+            while True:
+                # Hand off every complete message already buffered;
+                # errors raised by handler are the caller's and propagate
+                while True:
+                    try:
+                        span = self._pop_span()
+                    except ValueError as e:
+                        logger.error(f"Receive error: {e}")
+                        return
+                    if span is None:
+                        break
+                    handler(*span)
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(remaining):
+                    break
+
+                try:
+                    self._fill()
+                except BlockingIOError:
+                    continue
+                except OSError as e:
+                    logger.error(f"Receive error: {e}")
+                    break
+        finally:
+            selector.close()
+            self.socket.settimeout(timeout)
+
+    def disconnect(self):
+        """Send CLOSE_CONNECTION and close the socket"""
+        if self.socket:
+            try:
+                self._send_fixed('close_connection')
+
+                msg_type, msg_id, data = self.recv_message()
+                if msg_type == 0x10:  # CLOSE_CONNECTION_RESPONSE
+                    logger.info("Connection closed properly")
+            except Exception:
+                pass
+
+            self.socket.close()
+            logger.info("Disconnected")
+
@@ -4,70 +4,19 @@ Simple LLRP test without full client library
 Direct implementation for Bluebird FR900 testing
 """
 
-import socket
 import struct
 import time
 import logging
 
+from llrp_base_client import LLRPBaseClient
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class SimpleLLRPClient:
-    def __init__(self, host, port=5084):
-        self.host = host
-        self.port = port
-        self.socket = None
-        self.message_id = 1
-        
-    def connect(self):
-        """Connect to LLRP reader"""
-        try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(5.0)
-            self.socket.connect((self.host, self.port))
-            logger.info(f"Connected to {self.host}:{self.port}")
-            
-            # Read Reader Event Notification
-            data = self.socket.recv(1024)
-            if data:
-                logger.info(f"Received initial message: {len(data)} bytes")
-            return True
-        except Exception as e:
-            logger.error(f"Connection failed: {e}")
-            return False
-    
-    def send_message(self, msg_type, msg_data=b''):
-        """Send LLRP message"""
-        msg_id = self.message_id
-        self.message_id += 1
-        
-        # LLRP header: type(2) + length(4) + id(4)
-        length = 10 + len(msg_data)
-        header = struct.pack('!HII', msg_type, length, msg_id)
-        
-        message = header + msg_data
-        self.socket.send(message)
-        logger.info(f"Sent message type=0x{msg_type:04X}, len={length}, id={msg_id}")
-        return msg_id
-    
-    def recv_message(self):
-        """Receive LLRP message"""
-        # Read header
-        header = self.socket.recv(10)
-        if len(header) < 10:
-            return None
-            
-        msg_type, msg_len, msg_id = struct.unpack('!HHI', header[:10])
-        
-        # Read rest of message
-        remaining = msg_len - 10
-        if remaining > 0:
-            data = self.socket.recv(remaining)
-        else:
-            data = b''
-            
-        logger.info(f"Received message type=0x{msg_type:04X}, len={msg_len}, id={msg_id}")
-        return msg_type, msg_id, data
+class SimpleLLRPClient(LLRPBaseClient):
+    # Sends message types without the LLRP version bits
+    TYPE_PREFIX = 0x0000
+    CONNECT_TIMEOUT = 5.0
     
     def get_capabilities(self):
         """Send GET_READER_CAPABILITIES"""
@@ -169,49 +118,24 @@ class SimpleLLRPClient:
         """Read tags for specified duration"""
         logger.info(f"Reading tags for {duration} seconds...")
         
-        end_time = time.time() + duration
+        end_time = time.monotonic() + duration
         tag_count = 0
         
-        self.socket.settimeout(0.5)
-        
-        while time.time() < end_time:
-            try:
-                msg_type, msg_id, data = self.recv_message()
+        def handle(msg_type, msg_id, body_start, body_end):
+            nonlocal tag_count
+            
+            # RO_ACCESS_REPORT = 0x003D
+            if msg_type == 0x003D:
+                tag_count += 1
+                logger.info("Tag report #%d", tag_count)
                 
-                # RO_ACCESS_REPORT = 0x003D
-                if msg_type == 0x003D:
-                    tag_count += 1
-                    logger.info(f"Tag report #{tag_count}")
-                    
-                # READER_EVENT_NOTIFICATION = 0x003F
-                elif msg_type == 0x003F:
-                    logger.info("Reader event notification")
-                    
-            except socket.timeout:
-                continue
-            except Exception as e:
-                logger.error(f"Error reading: {e}")
-                break
+            # READER_EVENT_NOTIFICATION = 0x003F
+            elif msg_type == 0x003F:
+                logger.info("Reader event notification")
+        
+        self.read_until(end_time, handle)
         
         return tag_count
-    
-    def disconnect(self):
-        """Disconnect from reader"""
-        if self.socket:
-            # Send CLOSE_CONNECTION
-            # Message type 0x000E = CLOSE_CONNECTION
-            self.send_message(0x000E, b'')
-            
-            try:
-                # Try to receive response
-                msg_type, msg_id, data = self.recv_message()
-                if msg_type == 0x0010:  # CLOSE_CONNECTION_RESPONSE
-                    logger.info("Connection closed properly")
-            except:
-                pass
-            
-            self.socket.close()
-            logger.info("Disconnected")
 
 def main():
     # FR900 configuration
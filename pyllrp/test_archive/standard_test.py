@@ -5,14 +5,69 @@ Based on LLRP 1.1 specification
 """
 
 import socket
+import select
+import functools
 import struct
 import time
 import logging
-import binascii
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Precompiled wire formats
+_HDR = struct.Struct('!HII')    # Message header: Type, Length, ID
+_U8 = struct.Struct('!B')
+_U32 = struct.Struct('!I')
+_TLV = struct.Struct('!HH')     # Parameter header: Type, Length
+_TRIG = struct.Struct('!HHB')   # Trigger parameter: Type, Length, TriggerType
+_ROSPEC = struct.Struct('!IBB') # ROSpec fields: ID, Priority, CurrentState
+
+
+@functools.lru_cache(maxsize=None)
+def _build_rospec(rospec_id):
+    """Build the minimal ROSpec parameter for rospec_id, once per ID"""
+    # Layout (24 bytes), written in place at fixed offsets:
+    #  0 ROSpec header (Type=177)      4 ROSpecID, Priority, CurrentState
+    # 10 ROBoundarySpec header (178)  14 ROSpecStartTrigger (179): Null
+    # 19 ROSpecStopTrigger (180): Null
+    buf = bytearray(24)
+    _TLV.pack_into(buf, 0, 177, 24)
+    _ROSPEC.pack_into(buf, 4, rospec_id, 0, 0)  # Priority 0, Disabled
+    _TLV.pack_into(buf, 10, 178, 14)
+    _TRIG.pack_into(buf, 14, 179, 5, 0)  # Type, Length=5, TriggerType=0
+    _TRIG.pack_into(buf, 19, 180, 5, 0)  # Type, Length=5, TriggerType=0
+    return bytes(buf)
+
+
+# Static PDU bodies, built once at import
+_ROSPEC_123 = _build_rospec(123)
+
+# Bluebird custom message (from log analysis): VendorID, Subtype, 5 data bytes
+_CUSTOM_PAYLOAD = struct.pack('!IB', 0x00005E95, 0x00) + b'\x00\x00\x00\x00\x00'
+
+# Fixed-body control operations:
+# name -> (request type, response type, payload, success message, docstring)
+_OPS = {
+    'get_capabilities': (0x0001, 0x000B, _U8.pack(0),   # RequestedData: 0 = All
+                         "✓ Received capabilities response",
+                         "Send GET_READER_CAPABILITIES per LLRP spec"),
+    'set_reader_config': (0x0003, 0x000D, _U8.pack(0),  # Reset to factory: No
+                          "✓ Set reader config successful",
+                          "Send SET_READER_CONFIG"),
+    'delete_all_rospecs': (0x0015, 0x001F, _U32.pack(0),  # ROSpecID: 0 = Delete all
+                           "✓ Deleted all ROSpecs",
+                           "Delete all ROSpecs"),
+    'enable_rospec': (0x0018, 0x0022, _U32.pack(123),
+                      "✓ Enabled ROSpec",
+                      "Enable ROSpec ID 123"),
+    'start_rospec': (0x0016, 0x0020, _U32.pack(123),
+                     "✓ Started ROSpec",
+                     "Start ROSpec ID 123"),
+    'stop_rospec': (0x0017, 0x0021, _U32.pack(123),
+                    "✓ Stopped ROSpec",
+                    "Stop ROSpec ID 123"),
+}
+
 class LLRPStandardClient:
     """LLRP 1.1 Standard Compliant Client"""
     
@@ -22,12 +77,21 @@ class LLRPStandardClient:
         self.socket = None
         self.message_id = 1000
         
+        # Reusable header and receive buffers; the receive buffer grows on demand
+        self._hdrbuf = bytearray(10)
+        self._rxbuf = bytearray(65536)
+        
     def connect(self):
         """Connect to LLRP reader"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(10.0)
             self.socket.connect((self.host, self.port))
+            
+            # Command/response ping-pong of tiny PDUs: disable Nagle and delayed ACKs
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if hasattr(socket, 'TCP_QUICKACK'):  # Linux only
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
             logger.info(f"Connected to {self.host}:{self.port}")
             
             # Read initial Reader Event Notification
@@ -54,48 +118,82 @@ class LLRPStandardClient:
         type_field = (1 << 13) | (msg_type << 3)  # Version 1, Type, Reserved 0
         length = 10 + len(msg_data)
         
-        header = struct.pack('!HII', type_field, length, msg_id)
-        message = header + msg_data
+        _HDR.pack_into(self._hdrbuf, 0, type_field, length, msg_id)
         
-        logger.debug(f"Sending: Type=0x{msg_type:04X}, Len={length}, ID={msg_id}")
-        logger.debug(f"Header hex: {binascii.hexlify(header).decode()}")
-        logger.debug(f"Data hex: {binascii.hexlify(msg_data).decode()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending: Type=0x%04X, Len=%d, ID=%d", msg_type, length, msg_id)
+            logger.debug("Header hex: %s", self._hdrbuf.hex())
+            logger.debug("Data hex: %s", msg_data.hex())
         
-        self.socket.send(message)
+        self._send_iov(self._hdrbuf, msg_data)
         return msg_id
     
+    def _send_iov(self, *buffers):
+        """Send buffers back to back without joining them first"""
+        if not hasattr(self.socket, 'sendmsg'):  # e.g. Windows
+            self.socket.sendall(b''.join(buffers))
+            return
+        
+        # Scatter-gather send, advancing through the iovec on short sends
+        views = [memoryview(buf) for buf in buffers if buf]
+        while views:
+            sent = self.socket.sendmsg(views)
+            while views and sent >= len(views[0]):
+                sent -= len(views.pop(0))
+            if sent:
+                views[0] = views[0][sent:]
+    
     def recv_message(self):
         """Receive LLRP message with correct header parsing"""
         try:
-            # Read 10-byte header
-            header = self.socket.recv(10)
-            if len(header) < 10:
-                logger.error(f"Short header: {len(header)} bytes")
-                return None, None, None
+            # Peek at the header so the whole message can then be taken
+            # off the socket with a single recv_into
+            mv = memoryview(self._rxbuf)
+            off = 0
+            if self.socket.recv_into(mv, 10, socket.MSG_PEEK) < 10:
+                # Header split across segments; consume it piecewise
+                while off < 10:
+                    n = self.socket.recv_into(mv[off:10])
+                    if not n:
+                        break
+                    off += n
+                if off < 10:
+                    logger.error(f"Short header: {off} bytes")
+                    return None, None, None
             
-            logger.debug(f"Received header: {binascii.hexlify(header).decode()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received header: %s", mv[:10].hex())
             
             # Parse header
-            type_field, msg_len, msg_id = struct.unpack('!HII', header)
+            type_field, msg_len, msg_id = _HDR.unpack_from(self._rxbuf, 0)
             
             # Extract message type (bits 5-14)
             msg_type = (type_field >> 3) & 0x3FF
             
-            # Read message body
-            remaining = msg_len - 10
-            if remaining > 0:
-                data = b''
-                while len(data) < remaining:
-                    chunk = self.socket.recv(remaining - len(data))
-                    if not chunk:
-                        break
-                    data += chunk
-            else:
-                data = b''
+            # Grow the buffer if this message does not fit
+            if msg_len > len(self._rxbuf):
+                mv.release()
+                self._rxbuf.extend(bytes(msg_len - len(self._rxbuf)))
+                mv = memoryview(self._rxbuf)
+            
+            # Read the rest of the message (all of it, after a full peek);
+            # the header is always consumed, even when its length is invalid
+            end = max(msg_len, 10)
+            while off < end:
+                n = self.socket.recv_into(mv[off:end])
+                if not n:
+                    break
+                off += n
+            data = bytes(mv[10:off])
+            mv.release()
             
-            logger.info(f"Received: Type=0x{msg_type:04X}, Len={msg_len}, ID={msg_id}")
-            if data:
-                logger.debug(f"Data hex: {binascii.hexlify(data).decode()}")
+            if msg_len < 10:
+                logger.error(f"Invalid message length: {msg_len}")
+                return None, None, None
+            
+            logger.info("Received: Type=0x%04X, Len=%d, ID=%d", msg_type, msg_len, msg_id)
+            if data and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Data hex: %s", data.hex())
             
             return msg_type, msg_id, data
             
@@ -106,142 +204,33 @@ class LLRPStandardClient:
             logger.error(f"Receive error: {e}")
             return None, None, None
     
-    def get_capabilities(self):
-        """Send GET_READER_CAPABILITIES per LLRP spec"""
-        # Message type 1 = GET_READER_CAPABILITIES
-        # RequestedData: 0 = All capabilities
-        data = struct.pack('!B', 0)
-        self.send_message(0x0001, data)
-        
-        # Receive response
-        msg_type, msg_id, data = self.recv_message()
-        if msg_type == 0x000B:  # GET_READER_CAPABILITIES_RESPONSE
-            logger.info("✓ Received capabilities response")
-            return True
-        else:
-            logger.error(f"Unexpected response type: 0x{msg_type:04X}")
-        return False
-    
-    def set_reader_config(self):
-        """Send SET_READER_CONFIG"""
-        # Message type 3 = SET_READER_CONFIG
-        # Reset to factory: No (0)
-        data = struct.pack('!B', 0)
-        self.send_message(0x0003, data)
-        
-        msg_type, msg_id, data = self.recv_message()
-        if msg_type == 0x000D:  # SET_READER_CONFIG_RESPONSE
-            logger.info("✓ Set reader config successful")
-            return True
-        return False
-    
-    def delete_all_rospecs(self):
-        """Delete all ROSpecs"""
-        # Message type 21 = DELETE_ROSPEC
-        # ROSpecID: 0 = Delete all
-        data = struct.pack('!I', 0)
-        self.send_message(0x0015, data)
+    def _request(self, req_type, resp_type, payload, success):
+        """Send a request and check that the expected response type comes back"""
+        self.send_message(req_type, payload)
         
         msg_type, msg_id, data = self.recv_message()
-        if msg_type == 0x001F:  # DELETE_ROSPEC_RESPONSE
-            logger.info("✓ Deleted all ROSpecs")
+        if msg_type == resp_type:
+            logger.info(success)
             return True
+        logger.error("Unexpected response type: %s (expected 0x%04X)",
+                     f"0x{msg_type:04X}" if msg_type is not None else None, resp_type)
         return False
     
     def add_rospec(self):
         """Add a minimal ROSpec"""
         # Message type 20 = ADD_ROSPEC
-        # Build minimal valid ROSpec
-        rospec_data = bytearray()
-        
-        # ROSpec parameter header (Type=177, Length will be calculated)
-        rospec_type = 177
-        
-        # ROSpec fields
-        rospec_id = 123
-        priority = 0
-        current_state = 0  # Disabled
-        
-        rospec_body = struct.pack('!IBB', rospec_id, priority, current_state)
-        
-        # ROBoundarySpec (Type=178)
-        boundary_type = 178
-        
-        # ROSpecStartTrigger (Type=179): Null trigger
-        start_trigger = struct.pack('!HHB', 179, 5, 0)  # Type, Length=5, TriggerType=0
-        
-        # ROSpecStopTrigger (Type=180): Null trigger  
-        stop_trigger = struct.pack('!HHB', 180, 5, 0)  # Type, Length=5, TriggerType=0
-        
-        boundary_body = start_trigger + stop_trigger
-        boundary_header = struct.pack('!HH', boundary_type, 4 + len(boundary_body))
-        boundary_spec = boundary_header + boundary_body
-        
-        # Complete ROSpec parameter
-        rospec_content = rospec_body + boundary_spec
-        rospec_header = struct.pack('!HH', rospec_type, 4 + len(rospec_content))
-        rospec_param = rospec_header + rospec_content
-        
-        self.send_message(0x0014, rospec_param)
-        
-        msg_type, msg_id, data = self.recv_message()
-        if msg_type == 0x001E:  # ADD_ROSPEC_RESPONSE
-            logger.info("✓ Added ROSpec")
-            return True
-        return False
-    
-    def enable_rospec(self):
-        """Enable ROSpec ID 123"""
-        # Message type 24 = ENABLE_ROSPEC
-        data = struct.pack('!I', 123)
-        self.send_message(0x0018, data)
-        
-        msg_type, msg_id, data = self.recv_message()
-        if msg_type == 0x0022:  # ENABLE_ROSPEC_RESPONSE
-            logger.info("✓ Enabled ROSpec")
-            return True
-        return False
-    
-    def start_rospec(self):
-        """Start ROSpec ID 123"""
-        # Message type 22 = START_ROSPEC
-        data = struct.pack('!I', 123)
-        self.send_message(0x0016, data)
-        
-        msg_type, msg_id, data = self.recv_message()
-        if msg_type == 0x0020:  # START_ROSPEC_RESPONSE
-            logger.info("✓ Started ROSpec")
-            return True
-        return False
-    
-    def stop_rospec(self):
-        """Stop ROSpec ID 123"""
-        # Message type 23 = STOP_ROSPEC
-        data = struct.pack('!I', 123)
-        self.send_message(0x0017, data)
-        
-        msg_type, msg_id, data = self.recv_message()
-        if msg_type == 0x0021:  # STOP_ROSPEC_RESPONSE
-            logger.info("✓ Stopped ROSpec")
-            return True
-        return False
+        return self._request(0x0014, 0x001E, _ROSPEC_123, "✓ Added ROSpec")
     
     def send_custom_message(self):
         """Send Bluebird custom message"""
         # Message type 1023 = CUSTOM_MESSAGE
-        # Bluebird format from log analysis
-        vendor_id = 0x00005E95  # Bluebird vendor ID
-        subtype = 0x00
-        custom_data = b'\x00\x00\x00\x00\x00'
-        
-        data = struct.pack('!IB', vendor_id, subtype) + custom_data
-        self.send_message(0x03FF, data)
+        self.send_message(0x03FF, _CUSTOM_PAYLOAD)
         
         msg_type, msg_id, response = self.recv_message()
         if msg_type == 0x03FF:  # CUSTOM_MESSAGE response
             logger.info("✓ Received custom message response")
             if len(response) >= 4:
-                resp_vendor = struct.unpack('!I', response[:4])[0]
+                resp_vendor = _U32.unpack_from(response)[0]
                 logger.info(f"  Vendor ID: 0x{resp_vendor:08X}")
             return True
         return False
@@ -250,27 +239,33 @@ class LLRPStandardClient:
         """Read tags for specified duration"""
         logger.info(f"Reading tags for {duration} seconds...")
         
-        end_time = time.time() + duration
+        end_time = time.monotonic() + duration
         tag_count = 0
         event_count = 0
         
-        self.socket.settimeout(0.5)
-        
-        while time.time() < end_time:
+        while True:
+            # Sleep in the kernel until a report arrives or the deadline passes
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            readable, _, _ = select.select([self.socket], [], [], remaining)
+            if not readable:
+                break
+            
             msg_type, msg_id, data = self.recv_message()
             
             if msg_type is None:
-                continue
+                break
             
             # RO_ACCESS_REPORT = 61
             if msg_type == 0x003D:
                 tag_count += 1
-                logger.debug(f"Tag report #{tag_count}")
+                logger.debug("Tag report #%d", tag_count)
                 
             # READER_EVENT_NOTIFICATION = 63
             elif msg_type == 0x003F:
                 event_count += 1
-                logger.debug(f"Reader event #{event_count}")
+                logger.debug("Reader event #%d", event_count)
         
         return tag_count, event_count
     
@@ -292,6 +287,19 @@ class LLRPStandardClient:
             logger.info("Disconnected")
 
 
+
+def _make_op(name, req_type, resp_type, payload, success, doc):
+    def op(self):
+        return self._request(req_type, resp_type, payload, success)
+    op.__name__ = name
+    op.__qualname__ = f"LLRPStandardClient.{name}"
+    op.__doc__ = doc
+    return op
+
+
+for _name, _op in _OPS.items():
+    setattr(LLRPStandardClient, _name, _make_op(_name, *_op))
+
 def main():
     # FR900 configuration
     READER_IP = "192.168.10.106"
@@ -315,7 +323,6 @@ def main():
         # Send custom messages (Bluebird specific)
         print("\n[Phase 2: Bluebird Custom Messages]")
         client.send_custom_message()
-        time.sleep(0.1)
         client.send_custom_message()
         
         # Configure reader
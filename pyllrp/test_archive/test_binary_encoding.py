@@ -30,13 +30,15 @@ def test_tv_parameter_encoding():
     print("=" * 50)
     
     tests = [
-        ("AntennaID", AntennaID(antenna_id=5), 3, b'\x81\x00\x05'),
-        ("PeakRSSI", PeakRSSI(rssi=-45), 2, b'\x86\xd3'),  # -45 as signed byte
-        ("TagSeenCount", TagSeenCount(tag_count=123), 3, b'\x88\x00\x7b'),
-        ("ROSpecID", ROSpecID(rospec_id=456), 5, b'\x89\x00\x00\x01\xc8'),
+        ("AntennaID", AntennaID(antenna_id=5), 3, b'\x81\x00\x05', 'antenna_id'),
+        ("PeakRSSI", PeakRSSI(rssi=-45), 2, b'\x86\xd3', 'rssi'),  # -45 as signed byte
+        ("TagSeenCount", TagSeenCount(tag_count=123), 3, b'\x88\x00\x7b', 'tag_count'),
+        ("ROSpecID", ROSpecID(rospec_id=456), 5, b'\x89\x00\x00\x01\xc8', 'rospec_id'),
+        ("EPC96", EPC96(epc_96=0xE200001A2C0000000000BEEF), 13,
+         b'\x8d' + bytes.fromhex("E200001A2C0000000000BEEF"), 'epc'),  # MSB first
     ]
     
-    for name, param, expected_len, expected_bytes in tests:
+    for name, param, expected_len, expected_bytes, attr in tests:
         print(f"\n🧪 Testing {name}:")
         
         # Test encoding
@@ -49,13 +51,13 @@ def test_tv_parameter_encoding():
         new_param = type(param)()
         consumed = new_param.decode(encoded)
         print(f"   Decoded consumed: {consumed} bytes")
-        print(f"   Original value: {getattr(param, list(param.__dict__.keys())[1])}")  # Skip param_type
-        print(f"   Decoded value: {getattr(new_param, list(new_param.__dict__.keys())[1])}")
+        print(f"   Original value: {getattr(param, attr)}")
+        print(f"   Decoded value: {getattr(new_param, attr)}")
         
         # Verify round-trip
-        success = (consumed == expected_len and 
-                  getattr(param, list(param.__dict__.keys())[1]) == 
-                  getattr(new_param, list(new_param.__dict__.keys())[1]))
+        success = (encoded == expected_bytes and
+                  consumed == expected_len and 
+                  getattr(param, attr) == getattr(new_param, attr))
         print(f"   Result: {'✅ PASS' if success else '❌ FAIL'}")
 
 
@@ -257,6 +259,23 @@ def test_parameter_header_parsing():
                   is_tv == exp_tv)
         print(f"   Result: {'✅ PASS' if success else '❌ FAIL'}")
 
+    # Same cases back to back in one buffer, parsed in place at each offset
+    print("\n🧪 Testing all cases from one buffer:")
+
+    buf = b''.join(case[1] for case in test_cases)
+    offsets = []
+    offset = 0
+    for case in test_cases:
+        offsets.append(offset)
+        offset += len(case[1])
+
+    expected = [case[2:] for case in test_cases]
+    parsed = [LLRPParameter.parse_header(buf, offset) for offset in offsets]
+
+    print(f"   Buffer: {len(buf)} bytes, offsets {offsets}")
+    print(f"   Parsed: {parsed}")
+    print(f"   Result: {'✅ PASS' if parsed == expected else '❌ FAIL'}")
+
 
 def main():
     """Run all binary encoding tests"""
@@ -98,8 +98,8 @@ def main():
             print("Inventory started - Reading tags...")
             
             # Read for 10 seconds
-            start_time = time.time()
-            while time.time() - start_time < 10:
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
                 time.sleep(0.1)
                 # Tags are processed in callback
             
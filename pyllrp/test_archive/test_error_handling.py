@@ -5,7 +5,10 @@ Comprehensive Error Handling Test for LLRP Library
 Tests various error scenarios and recovery mechanisms
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import time
 from llrp.client import LLRPClient
 from llrp.errors import (
@@ -15,17 +18,48 @@ from llrp.errors import (
 )
 from llrp.protocol import LLRPStatus
 
+# Log file writes happen on a listener thread, off the tests' logging calls
+_log_queue = queue.SimpleQueue()
+_file_listener = logging.handlers.QueueListener(
+    _log_queue, logging.FileHandler('llrp_error_test.log'), respect_handler_level=True
+)
+_file_listener.start()
+atexit.register(_file_listener.stop)
+
 # Setup comprehensive logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler('llrp_error_test.log')
+        logging.handlers.QueueHandler(_log_queue)
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Fixed scenario tables, built once at import: (code, description)
+_ROSPEC_ERRORS = (
+    (LLRPStatusCode.M_NoSuchROSpec, "ROSpec ID 123 does not exist"),
+    (LLRPStatusCode.M_ROSpecCurrentlyEnabled, "Cannot modify enabled ROSpec"),
+    (LLRPStatusCode.M_NoMoreROSpecs, "Maximum ROSpec limit reached"),
+    (LLRPStatusCode.M_ROSpecNotConfigured, "ROSpec missing required parameters"),
+)
+
+_DEVICE_ERRORS = (
+    (LLRPStatusCode.M_NoAntennaConnected, "No antenna on port 4"),
+    (LLRPStatusCode.M_ReaderTemperatureTooHigh, "Temperature: 85°C"),
+    (LLRPStatusCode.M_InvalidFrequency, "915.5 MHz not supported in this region"),
+    (LLRPStatusCode.M_InvalidPowerLevel, "35 dBm exceeds maximum 30 dBm"),
+)
+
+# (scenario, code, description)
+_ERROR_SCENARIOS = (
+    ("Reader Connection Lost", LLRPStatusCode.M_Other, "TCP connection reset"),
+    ("Invalid ROSpec Configuration", LLRPStatusCode.M_ParameterError, "Missing AISpec"),
+    ("Antenna Malfunction", LLRPStatusCode.M_NoAntennaConnected, "Antenna 2 cable disconnected"),
+    ("Temperature Alert", LLRPStatusCode.M_ReaderTemperatureTooHigh, "Internal temp 90°C"),
+)
+
 
 def test_error_code_system():
     """Test LLRP error code system"""
@@ -42,12 +76,11 @@ def test_error_code_system():
         999  # Unknown code
     ]
     
-    for code in test_codes:
-        try:
-            exception = create_llrp_exception(code, f"Test error for code {code}")
-            print(f"   Code {code}: {exception.__class__.__name__} - {exception}")
-        except Exception as e:
-            print(f"   Code {code}: Error creating exception - {e}")
+    # create_llrp_exception handles any integer code, unknown ones included
+    message = "Test error for code %d".__mod__
+    exceptions = [(code, create_llrp_exception(code, message(code))) for code in test_codes]
+    print("\n".join(f"   Code {code}: {type(exception).__name__} - {exception}"
+                    for code, exception in exceptions))
     
     # Test LLRPStatus methods
     print("\n📋 Testing LLRPStatus methods:")
@@ -64,7 +97,7 @@ def test_error_code_system():
     try:
         error_status.raise_if_error()
     except LLRPError as e:
-        print(f"   ✅ Correctly raised: {e.__class__.__name__}")
+        print(f"   ✅ Correctly raised: {type(e).__name__}")
 
 
 def test_connection_error_handling():
@@ -120,16 +153,8 @@ def test_rospec_error_scenarios():
     print("\n📡 Testing ROSpec Error Scenarios")
     print("=" * 50)
     
-    # Simulate common ROSpec errors
-    rospec_errors = [
-        (LLRPStatusCode.M_NoSuchROSpec, "ROSpec ID 123 does not exist"),
-        (LLRPStatusCode.M_ROSpecCurrentlyEnabled, "Cannot modify enabled ROSpec"),
-        (LLRPStatusCode.M_NoMoreROSpecs, "Maximum ROSpec limit reached"),
-        (LLRPStatusCode.M_ROSpecNotConfigured, "ROSpec missing required parameters"),
-    ]
-    
-    for code, description in rospec_errors:
-        print(f"\n🧪 Testing {LLRPStatusCode(code).name}:")
+    for code, description in _ROSPEC_ERRORS:
+        print(f"\n🧪 Testing {code.name}:")
         
         # Create status
         status = LLRPStatus(code, description)
@@ -141,7 +166,7 @@ def test_rospec_error_scenarios():
         try:
             check_llrp_response(code, description, raise_on_error=True)
         except LLRPError as e:
-            print(f"   ✅ Correctly raised {e.__class__.__name__}: {e}")
+            print(f"   ✅ Correctly raised {type(e).__name__}: {e}")
         except Exception as e:
             print(f"   ❌ Unexpected exception: {e}")
 
@@ -151,15 +176,8 @@ def test_device_error_scenarios():
     print("\n🔧 Testing Device Error Scenarios")
     print("=" * 50)
     
-    device_errors = [
-        (LLRPStatusCode.M_NoAntennaConnected, "No antenna on port 4"),
-        (LLRPStatusCode.M_ReaderTemperatureTooHigh, "Temperature: 85°C"),
-        (LLRPStatusCode.M_InvalidFrequency, "915.5 MHz not supported in this region"),
-        (LLRPStatusCode.M_InvalidPowerLevel, "35 dBm exceeds maximum 30 dBm"),
-    ]
-    
-    for code, description in device_errors:
-        print(f"\n🧪 Testing {LLRPStatusCode(code).name}:")
+    for code, description in _DEVICE_ERRORS:
+        print(f"\n🧪 Testing {code.name}:")
         
         try:
             status = LLRPStatus(code, description)
@@ -167,7 +185,7 @@ def test_device_error_scenarios():
         except LLRPDeviceError as e:
             print(f"   ✅ Correctly raised LLRPDeviceError: {e}")
         except LLRPError as e:
-            print(f"   ⚠️  Raised {e.__class__.__name__}: {e}")
+            print(f"   ⚠️  Raised {type(e).__name__}: {e}")
         except Exception as e:
             print(f"   ❌ Unexpected exception: {e}")
 
@@ -180,28 +198,29 @@ def test_error_recovery_patterns():
     print("🧪 Testing retry pattern with exponential backoff:")
     
     def unreliable_operation():
-        """Simulate an unreliable operation"""
+        """Simulate an unreliable operation, returning (ok, status_code)"""
         import random
-        if random.random() < 0.7:  # 70% failure rate
-            raise LLRPConnectionError(LLRPStatusCode.M_Other, "Simulated connection failure")
-        return "Success"
+        if random.getrandbits(8) < 179:  # ~70% failure rate
+            return False, LLRPStatusCode.M_Other
+        return True, LLRPStatusCode.M_Success
     
     max_retries = 3
     base_delay = 0.1
     
+    # Failures are plain status codes; an exception is only built for the final one
     for attempt in range(max_retries):
-        try:
-            result = unreliable_operation()
-            print(f"   ✅ Operation succeeded on attempt {attempt + 1}: {result}")
+        ok, code = unreliable_operation()
+        if ok:
+            print(f"   ✅ Operation succeeded on attempt {attempt + 1}: Success")
             break
-        except LLRPError as e:
-            if attempt < max_retries - 1:
-                delay = base_delay * (2 ** attempt)  # Exponential backoff
-                print(f"   ⚠️  Attempt {attempt + 1} failed: {e}")
-                print(f"   ⏳ Retrying in {delay:.1f}s...")
-                time.sleep(delay)
-            else:
-                print(f"   ❌ All {max_retries} attempts failed: {e}")
+        if attempt < max_retries - 1:
+            delay = base_delay * (2 ** attempt)  # Exponential backoff
+            print(f"   ⚠️  Attempt {attempt + 1} failed: status {code} ({code.name})")
+            print(f"   ⏳ Retrying in {delay:.1f}s...")
+            time.sleep(delay)
+        else:
+            e = LLRPConnectionError(code, "Simulated connection failure")
+            print(f"   ❌ All {max_retries} attempts failed: {e}")
 
 
 def test_comprehensive_error_logging():
@@ -209,28 +228,21 @@ def test_comprehensive_error_logging():
     print("\n📝 Testing Comprehensive Error Logging")
     print("=" * 50)
     
-    # Create various error scenarios and log them
-    error_scenarios = [
-        ("Reader Connection Lost", LLRPStatusCode.M_Other, "TCP connection reset"),
-        ("Invalid ROSpec Configuration", LLRPStatusCode.M_ParameterError, "Missing AISpec"),
-        ("Antenna Malfunction", LLRPStatusCode.M_NoAntennaConnected, "Antenna 2 cable disconnected"),
-        ("Temperature Alert", LLRPStatusCode.M_ReaderTemperatureTooHigh, "Internal temp 90°C"),
-    ]
-    
     print("🧪 Generating error logs:")
     
-    for scenario, code, description in error_scenarios:
+    log_error = logger.error
+    for scenario, code, description in _ERROR_SCENARIOS:
         print(f"\n   Scenario: {scenario}")
         
         # Log using different methods
-        logger.error(f"Test scenario: {scenario}")
+        log_error("Test scenario: %s", scenario)
         
         try:
             status = LLRPStatus(code, description)
             status.raise_if_error()
         except LLRPError as e:
-            logger.error(f"LLRP Error in {scenario}: {e}", exc_info=False)
-            print(f"   Logged: {e.__class__.__name__}")
+            log_error("LLRP Error in %s: %s", scenario, e, exc_info=False)
+            print(f"   Logged: {type(e).__name__}")
 
 
 def simulate_reader_interaction():
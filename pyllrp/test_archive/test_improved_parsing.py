@@ -4,6 +4,10 @@ Test script demonstrating improved tag report parsing
 """
 
 import logging
+import sys
+import threading
+from collections import Counter, deque
+from operator import itemgetter
 from llrp.client import LLRPClient
 
 # Setup detailed logging
@@ -12,61 +16,121 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
-def detailed_tag_callback(tag_info):
-    """Enhanced callback showing all parsed tag information"""
-    print("=" * 60)
-    print("🏷️  TAG DETECTED")
-    print("=" * 60)
+def format_detailed_tag(tag_info):
+    """Render all parsed tag information as one block of text"""
+    lines = ["=" * 60, "🏷️  TAG DETECTED", "=" * 60]
+    add = lines.append
     
     # Basic information
-    print(f"EPC: {tag_info['epc']}")
+    add(f"EPC: {tag_info['epc']}")
     if tag_info['antenna_id'] is not None:
-        print(f"Antenna: {tag_info['antenna_id']}")
+        add(f"Antenna: {tag_info['antenna_id']}")
     if tag_info['rssi'] is not None:
-        print(f"RSSI: {tag_info['rssi']} dBm")
+        add(f"RSSI: {tag_info['rssi']} dBm")
     if tag_info['channel_index'] is not None:
-        print(f"Channel: {tag_info['channel_index']}")
+        add(f"Channel: {tag_info['channel_index']}")
     
     # Timing information
     if tag_info['first_seen']:
-        print(f"First Seen: {tag_info['first_seen']} μs")
+        add(f"First Seen: {tag_info['first_seen']} μs")
     if tag_info['last_seen']:
-        print(f"Last Seen: {tag_info['last_seen']} μs")
+        add(f"Last Seen: {tag_info['last_seen']} μs")
     if tag_info['seen_count'] is not None:
-        print(f"Seen Count: {tag_info['seen_count']}")
+        add(f"Seen Count: {tag_info['seen_count']}")
     
     # ROSpec information
     if tag_info['rospec_id'] is not None:
-        print(f"ROSpec ID: {tag_info['rospec_id']}")
+        add(f"ROSpec ID: {tag_info['rospec_id']}")
     if tag_info['spec_index'] is not None:
-        print(f"Spec Index: {tag_info['spec_index']}")
+        add(f"Spec Index: {tag_info['spec_index']}")
     if tag_info['inventory_param_spec_id'] is not None:
-        print(f"Inventory Param Spec ID: {tag_info['inventory_param_spec_id']}")
+        add(f"Inventory Param Spec ID: {tag_info['inventory_param_spec_id']}")
     
     # Access information
     if tag_info['access_spec_id'] is not None:
-        print(f"Access Spec ID: {tag_info['access_spec_id']}")
+        add(f"Access Spec ID: {tag_info['access_spec_id']}")
     
     # Detailed timestamps
     if tag_info['first_seen_utc']:
-        print(f"First Seen (UTC): {tag_info['first_seen_utc']} μs")
+        add(f"First Seen (UTC): {tag_info['first_seen_utc']} μs")
     if tag_info['first_seen_uptime']:
-        print(f"First Seen (Uptime): {tag_info['first_seen_uptime']} μs")
+        add(f"First Seen (Uptime): {tag_info['first_seen_uptime']} μs")
     if tag_info['last_seen_utc']:
-        print(f"Last Seen (UTC): {tag_info['last_seen_utc']} μs")
+        add(f"Last Seen (UTC): {tag_info['last_seen_utc']} μs")
     if tag_info['last_seen_uptime']:
-        print(f"Last Seen (Uptime): {tag_info['last_seen_uptime']} μs")
+        add(f"Last Seen (Uptime): {tag_info['last_seen_uptime']} μs")
+    
+    return "\n".join(lines) + "\n"
+
+
+def detailed_tag_callback(tag_info):
+    """Enhanced callback showing all parsed tag information"""
+    sys.stdout.write(format_detailed_tag(tag_info))
+
+
+class TagSink:
+    """Bounded ring of tag reports, printed in batches by a background thread
+    
+    Pass put() as the tag callback: it only stores the report, so the
+    client's receive thread never waits on formatting or stdout. If the
+    printer falls more than `capacity` reports behind, the oldest are dropped;
+    the number dropped is kept in `dropped` and reported by close().
+    """
+    
+    def __init__(self, capacity=4096, batch=64, formatter=format_detailed_tag):
+        self._ring = deque(maxlen=capacity)
+        self._batch = batch
+        self._formatter = formatter
+        self._wakeup = threading.Event()
+        self._closed = False
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+    
+    def put(self, tag_info):
+        """Queue one tag report; wakes the printer once a batch is waiting"""
+        if len(self._ring) == self._ring.maxlen:
+            self.dropped += 1  # append below pushes out the oldest report
+        self._ring.append(tag_info)
+        if len(self._ring) >= self._batch:
+            self._wakeup.set()
+    
+    def close(self):
+        """Print whatever is still queued and stop the printer thread"""
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join()
+        if self.dropped:
+            print(f"⚠️  {self.dropped} tag reports dropped - printer fell behind")
+    
+    def _drain(self):
+        ring = self._ring
+        while True:
+            # Flush on a full batch, or every 100 ms for a trickle of reads
+            self._wakeup.wait(0.1)
+            self._wakeup.clear()
+            closed = self._closed
+            
+            chunk = []
+            while ring:
+                chunk.append(self._formatter(ring.popleft()))
+            if chunk:
+                sys.stdout.write("".join(chunk))
+            
+            if closed:
+                return
+
+
+# One-line tag summary, parsed once; fields: epc, antenna, rssi, count
+_SIMPLE_TAG_LINE = "📡 Tag: {:.16}... | Antenna: {} | RSSI: {}dBm | Count: {}".format
 
 
 def simple_tag_callback(tag_info):
     """Simple callback showing basic information"""
-    epc = tag_info['epc'] or 'Unknown'
-    antenna = tag_info['antenna_id'] or '?'
-    rssi = tag_info['rssi'] or '?'
-    count = tag_info['seen_count'] or '?'
-    
-    print(f"📡 Tag: {epc[:16]}... | Antenna: {antenna} | "
-          f"RSSI: {rssi}dBm | Count: {count}")
+    print(_SIMPLE_TAG_LINE(tag_info['epc'] or 'Unknown',
+                           tag_info['antenna_id'] or '?',
+                           tag_info['rssi'] or '?',
+                           tag_info['seen_count'] or '?'))
 
 
 def main():
@@ -115,21 +179,26 @@ def main():
         print(f"\n📊 Results: {len(tags)} total tag reads")
         
         if tags:
+            # Pull every field out in one pass, transposed into per-field columns
+            fields = ('epc', 'antenna_id', 'rssi', 'seen_count', 'first_seen')
+            columns = dict(zip(fields, zip(*map(itemgetter(*fields), tags))))
+            epcs = columns['epc']
+            
             # Show unique EPCs
-            unique_epcs = set(tag['epc'] for tag in tags if tag['epc'])
+            unique_epcs = set(filter(None, epcs))
             print(f"🏷️  Unique EPCs: {len(unique_epcs)}")
             
             # Show parsing success rate
-            parsed_epcs = sum(1 for tag in tags if tag['epc'])
+            parsed_epcs = sum(map(bool, epcs))
             success_rate = (parsed_epcs / len(tags)) * 100 if tags else 0
             print(f"✅ EPC Parsing Success: {success_rate:.1f}%")
             
             # Show field availability
             fields_available = {
-                'antenna_id': sum(1 for tag in tags if tag['antenna_id'] is not None),
-                'rssi': sum(1 for tag in tags if tag['rssi'] is not None),
-                'seen_count': sum(1 for tag in tags if tag['seen_count'] is not None),
-                'timestamps': sum(1 for tag in tags if tag['first_seen'] is not None),
+                'antenna_id': len(tags) - columns['antenna_id'].count(None),
+                'rssi': len(tags) - columns['rssi'].count(None),
+                'seen_count': len(tags) - columns['seen_count'].count(None),
+                'timestamps': len(tags) - columns['first_seen'].count(None),
             }
             
             print(f"📈 Field Availability:")
@@ -143,13 +212,16 @@ def main():
         
         # Test 2: Detailed reading with full callback
         print("Starting detailed inventory with full parsing info...")
-        reader.tags_read.clear()  # Clear previous results
         
-        tags = reader.simple_inventory(
-            duration_seconds=5.0,
-            antenna_ids=None,
-            tag_callback=detailed_tag_callback
-        )
+        sink = TagSink()
+        try:
+            tags = reader.simple_inventory(
+                duration_seconds=5.0,
+                antenna_ids=None,
+                tag_callback=sink.put
+            )
+        finally:
+            sink.close()
         
         print(f"\n📊 Detailed Results: {len(tags)} total tag reads")
         
@@ -157,21 +229,21 @@ def main():
         if tags:
             print(f"\n🔍 PARSING ANALYSIS:")
             
-            # Group by EPC
-            epc_groups = {}
+            # Count reads per EPC, keeping the first read of each as a sample
+            epc_counts = Counter()
+            epc_samples = {}
             for tag in tags:
                 epc = tag['epc'] or 'Unknown'
-                if epc not in epc_groups:
-                    epc_groups[epc] = []
-                epc_groups[epc].append(tag)
+                epc_counts[epc] += 1
+                epc_samples.setdefault(epc, tag)
             
             print(f"📋 Tag Summary:")
-            for epc, tag_list in epc_groups.items():
+            for epc, read_count in epc_counts.most_common():
                 epc_display = epc[:24] + "..." if len(epc) > 24 else epc
-                print(f"   {epc_display}: {len(tag_list)} reads")
+                print(f"   {epc_display}: {read_count} reads")
                 
                 # Show field completeness for this EPC
-                sample = tag_list[0]
+                sample = epc_samples[epc]
                 completeness = []
                 if sample['antenna_id'] is not None: completeness.append("Antenna")
                 if sample['rssi'] is not None: completeness.append("RSSI") 
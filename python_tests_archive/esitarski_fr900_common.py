@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+FR900 esitarski/pyllrp 테스트 스크립트 공용 도우미
+================================================
+
+여러 esitarski_fr900_*.py 스크립트가 함께 쓰는 리더 탐색/연결/설정/로깅/EPC 포맷 코드
+각 스크립트는 esitarski/pyllrp 임포트를 확인한 뒤 이 모듈을 임포트
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import socket
+import time
+from pathlib import Path
+
+from esitarski_pyllrp.pyllrp.AutoDetect import AutoDetect
+from esitarski_pyllrp.pyllrp.pyllrp import (
+    DELETE_ROSPEC_Message, DISABLE_ROSPEC_Message, HexFormatToStr, WaitForMessage
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """asctime을 초 단위로 캐시 - 같은 초 안의 로그는 strftime을 다시 하지 않음"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached = (None, '')  # (초, 포맷된 문자열) - 스레드 간 한 번에 교체
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        cached_sec, text = self._cached
+        if sec != cached_sec:
+            text = time.strftime(self.default_time_format, self.converter(sec))
+            self._cached = (sec, text)
+        return self.default_msec_format % (text, record.msecs)
+
+
+def setup_queue_logging(level=logging.INFO):
+    """루트 로거를 큐 기반으로 설정
+
+    포맷과 출력은 QueueListener 스레드가 담당하고, 리스너/메인 스레드는 큐에 넣기만 함
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(CachedTimeFormatter('%(asctime)s - %(levelname)s - %(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # 큐에는 인자만 합친 메시지를 넣음 - 시각/레벨 접두어는 리스너 쪽 포매터가 붙임
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=level, handlers=[queue_handler])
+
+
+def epc_hex(epc):
+    """EPC를 대문자 16진수 문자열로 - bytes면 C 구현인 hex() 사용"""
+    if isinstance(epc, (bytes, bytearray)):
+        return epc.hex().upper()
+    if isinstance(epc, (list, tuple)):
+        # 바이트 값 목록도 bytes로 바꿔 같은 경로로 - 바이트마다 "%02X" 포맷 안 함
+        try:
+            return bytes(epc).hex().upper()
+        except (TypeError, ValueError):
+            pass
+    return HexFormatToStr(epc)
+
+
+def tune_reader_socket(sock):
+    """요청/응답이 작은 LLRP 제어 메시지용 소켓 설정 - Nagle을 끔(TCP_NODELAY)"""
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+def transact_batch(connector, messages):
+    """메시지를 모두 먼저 보내고 응답을 순서대로 수신 (왕복 1회)
+
+    리스너 시작 전에만 사용 - 응답을 소켓에서 직접 읽음
+    """
+    for message in messages:
+        connector.send(message)
+    return [WaitForMessage(message.MessageID, connector.readerSocket)
+            for message in messages]
+
+
+def run_setup_chain(connector, chain, rospec_id):
+    """설정 메시지를 한 번에 전송하고 응답을 순서대로 확인
+
+    chain은 (단계, 메시지, 실패시 중단 여부) 목록. 첫 필수 단계 실패에서 중단하고,
+    뒤쪽 메시지는 이미 리더에 도착했으므로 rospec_id ROSpec을 되돌림
+    """
+    try:
+        responses = transact_batch(connector, [message for _, message, _ in chain])
+    except Exception as e:
+        logger.error(f"❌ 설정 메시지 전송 오류: {e}")
+        return False
+
+    for (label, _, required), response in zip(chain, responses):
+        if response.success() or not required:
+            logger.info(f"✅ {label}")
+            continue
+
+        logger.error(f"❌ {label} 실패: {response}")
+        try:
+            transact_batch(connector, [
+                DISABLE_ROSPEC_Message(ROSpecID=rospec_id),
+                DELETE_ROSPEC_Message(ROSpecID=rospec_id),
+            ])
+        except Exception as e:
+            logger.error(f"❌ ROSpec 되돌리기 오류: {e}")
+        return False
+
+    return True
+
+
+# 마지막으로 찾은 리더 IP - 다음 실행에서 AutoDetect 브로드캐스트 대기를 건너뜀
+READER_IP_CACHE = Path.home() / '.fr900_reader_ip'
+DEFAULT_READER_IP = "192.168.10.102"
+
+_detected_ip = None  # 이번 프로세스에서 AutoDetect로 찾은 IP - 다시 브로드캐스트하지 않음
+
+
+def detect_reader_ip():
+    """AutoDetect로 리더 찾기 - 프로세스마다 한 번만 탐지하고 찾은 IP는 파일에 저장"""
+    global _detected_ip
+    if _detected_ip is not None:
+        return _detected_ip
+
+    try:
+        reader_ip, computer_ip = AutoDetect()
+    except Exception:
+        reader_ip = None
+
+    if reader_ip:
+        print(f"🔍 리더 자동 탐지: {reader_ip}")
+        try:
+            READER_IP_CACHE.write_text(reader_ip)
+        except OSError:
+            pass
+        _detected_ip = reader_ip
+    else:
+        print(f"🔍 기본 리더 IP 사용: {DEFAULT_READER_IP}")
+        _detected_ip = DEFAULT_READER_IP
+    return _detected_ip
+
+
+def find_reader_ip():
+    """리더 IP 찾기 - 저장된 IP가 있으면 AutoDetect 생략
+
+    저장된 IP로 미리 연결해 보지 않음 - FR900은 클라이언트를 하나만 받으므로 시험 연결을
+    닫자마자 다시 연결하면 리더 쪽 세션 정리와 겹칠 수 있음. 확인은 connect_reader의
+    첫 실제 연결이 맡음
+    """
+    try:
+        cached_ip = READER_IP_CACHE.read_text().strip()
+    except OSError:
+        cached_ip = ''
+
+    if cached_ip:
+        print(f"🔍 저장된 리더 IP 사용: {cached_ip}")
+        return cached_ip
+    return detect_reader_ip()
+
+
+def connect_reader(connect, reader_ip):
+    """connect(reader_ip)로 리더에 연결 - 실패하면 AutoDetect로 찾은 IP로 한 번 더 시도
+
+    (connect 반환값, 실제로 연결한 IP)를 반환
+    """
+    try:
+        return connect(reader_ip), reader_ip
+    except Exception as e:
+        detected_ip = detect_reader_ip()
+        if detected_ip == reader_ip:
+            raise
+        logger.warning(f"⚠️ {reader_ip} 연결 실패({e}) - {detected_ip}로 다시 연결")
+        return connect(detected_ip), detected_ip
@@ -12,8 +12,10 @@ FR900 with esitarski/pyllrp - Complete Flow Version
 """
 
 import sys
+import threading
 import time
 import logging
+from collections import deque
 from datetime import datetime
 
 # esitarski/pyllrp 라이브러리 임포트
@@ -22,18 +24,20 @@ sys.path.insert(0, 'esitarski_pyllrp')
 try:
     from esitarski_pyllrp.pyllrp.pyllrp import *
     from esitarski_pyllrp.pyllrp.LLRPConnector import LLRPConnector
-    from esitarski_pyllrp.pyllrp.AutoDetect import AutoDetect
 except ImportError as e:
     print(f"esitarski/pyllrp 라이브러리를 찾을 수 없습니다: {e}")
     sys.exit(1)
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+from esitarski_fr900_common import (
+    connect_reader, find_reader_ip, run_setup_chain, setup_queue_logging, transact_batch,
+    tune_reader_socket
 )
+
+# 로깅 설정
+setup_queue_logging()
 logger = logging.getLogger(__name__)
 
+
 class FR900CompleteFlow:
     """FR900용 완전한 통신 플로우 구현"""
     
@@ -41,6 +45,9 @@ class FR900CompleteFlow:
         self.reader_ip = reader_ip
         self.connector = None
         self.tag_count = 0
+        self.pending_tags = deque()  # 리스너 스레드 → 메인 스레드 로그 출력
+        self.seen_epcs = set()       # 원시 EPC bytes - 16진수 변환은 출력할 때만
+        self._stop = threading.Event()  # 읽기 대기용 - 시간 제한까지 블록
         
         # 성공한 패킷에서 추출한 값들
         self.ROSPEC_ID = 1234
@@ -49,161 +56,106 @@ class FR900CompleteFlow:
         self.ANTENNA_IDS = [1]
         self.REPORT_N_VALUE = 1
         
+        self._rospec = self._build_rospec()
+        
+    def _build_rospec(self):
+        """ROSpec 파라미터 트리 - 실행마다 같으므로 __init__에서 한 번만 생성"""
+        return ROSpec_Parameter(
+            ROSpecID=self.ROSPEC_ID,
+            CurrentState=ROSpecState.Disabled,
+            Parameters=[
+                ROBoundarySpec_Parameter(Parameters=[
+                    ROSpecStartTrigger_Parameter(
+                        ROSpecStartTriggerType=ROSpecStartTriggerType.Immediate
+                    ),
+                    ROSpecStopTrigger_Parameter(
+                        ROSpecStopTriggerType=ROSpecStopTriggerType.Null
+                    )
+                ]),
+                AISpec_Parameter(
+                    AntennaIDs=self.ANTENNA_IDS,
+                    Parameters=[
+                        AISpecStopTrigger_Parameter(
+                            AISpecStopTriggerType=AISpecStopTriggerType.Null
+                        ),
+                        InventoryParameterSpec_Parameter(
+                            InventoryParameterSpecID=self.INVENTORY_PARAM_ID,
+                            ProtocolID=AirProtocols.EPCGlobalClass1Gen2
+                        )
+                    ]
+                ),
+                ROReportSpec_Parameter(
+                    ROReportTrigger=ROReportTriggerType.Upon_N_Tags_Or_End_Of_ROSpec,
+                    N=self.REPORT_N_VALUE,
+                    Parameters=[
+                        TagReportContentSelector_Parameter(
+                            EnableAntennaID=True,
+                            EnableFirstSeenTimestamp=True,
+                            EnablePeakRSSI=True
+                        )
+                    ]
+                )
+            ]
+        )
+    
     def access_report_handler(self, connector, access_report):
-        """RO_ACCESS_REPORT 메시지 핸들러"""
+        """RO_ACCESS_REPORT 메시지 핸들러 - 집계만 하고 로그 출력은 log_pending_tags에서
+        
+        같은 태그의 반복 읽기는 개수만 세고, 처음 본 EPC만 로그 대기열에 넣음
+        """
+        # 개수는 지역 변수로 세고 리포트당 한 번만 반영
+        count = self.tag_count
         try:
+            queue_tag = self.pending_tags.append
+            seen = self.seen_epcs
             for tag_data in access_report.getTagData():
-                self.tag_count += 1
-                epc = HexFormatToStr(tag_data['EPC'])
-                
-                info = {
-                    'count': self.tag_count,
-                    'epc': epc,
-                    'antenna_id': tag_data.get('AntennaID', 'N/A'),
-                    'rssi': tag_data.get('PeakRSSI', 'N/A'),
-                    'timestamp': tag_data.get('FirstSeenTimestampUTC', 'N/A')
-                }
-                
-                logger.info(f"🏷️  태그 #{info['count']}: {info['epc']}")
-                logger.info(f"    📶 RSSI: {info['rssi']} dBm, 📍 안테나: {info['antenna_id']}")
-                
+                count += 1
+                epc = bytes(tag_data['EPC'])
+                if epc in seen:
+                    continue
+                seen.add(epc)
+                # 로그에 필요한 값만 보관 - 리포트 dict는 바로 버려지도록
+                queue_tag((count, epc, tag_data.get('AntennaID', 'N/A'),
+                           tag_data.get('PeakRSSI', 'N/A')))
         except Exception as e:
             logger.error(f"태그 데이터 처리 중 오류: {e}")
+        finally:
+            self.tag_count = count
     
-    def step1_get_reader_capabilities(self):
-        """1단계: GET_READER_CAPABILITIES"""
-        logger.info("📋 1. GET_READER_CAPABILITIES")
-        try:
-            response = self.connector.transact(GET_READER_CAPABILITIES_Message())
-            if response.success():
-                logger.info("✅ 리더 기능 정보 수신 성공")
-                return True
-            else:
-                logger.error(f"❌ GET_READER_CAPABILITIES 실패: {response}")
-                return False
-        except Exception as e:
-            logger.error(f"❌ GET_READER_CAPABILITIES 오류: {e}")
-            return False
-    
-    def step2_initial_config(self):
-        """2단계: 초기 설정"""
-        logger.info("⚙️  2. 초기 리더 설정")
-        try:
-            response = self.connector.transact(SET_READER_CONFIG_Message(ResetToFactoryDefault=True))
-            if response.success():
-                logger.info("✅ 공장 초기화 완료")
-                return True
-            else:
-                logger.error(f"❌ 초기 설정 실패: {response}")
-                return False
-        except Exception as e:
-            logger.error(f"❌ 초기 설정 오류: {e}")
-            return False
-    
-    def step3_cleanup_specs(self):
-        """3단계: 기존 Spec 정리"""
-        logger.info("🧹 3. 기존 ROSpec/AccessSpec 정리")
-        try:
-            # ROSpec 정리
-            self.connector.transact(DISABLE_ROSPEC_Message(ROSpecID=0))  # 모든 ROSpec
-            response1 = self.connector.transact(DELETE_ROSPEC_Message(ROSpecID=0))  # 모든 ROSpec
-            
-            # AccessSpec 정리 
-            response2 = self.connector.transact(DELETE_ACCESSSPEC_Message(AccessSpecID=0))  # 모든 AccessSpec
-            
-            logger.info("✅ ROSpec 및 AccessSpec 정리 완료")
-            return True
-        except Exception as e:
-            logger.error(f"❌ Spec 정리 오류: {e}")
-            return False
-    
-    def step4_create_rospec(self):
-        """4단계: ROSpec 생성 및 추가"""
-        logger.info("📝 4. ROSpec 생성 및 추가")
-        try:
-            rospec_msg = ADD_ROSPEC_Message(
-                Parameters=[
-                    ROSpec_Parameter(
-                        ROSpecID=self.ROSPEC_ID,
-                        CurrentState=ROSpecState.Disabled,
-                        Parameters=[
-                            ROBoundarySpec_Parameter(Parameters=[
-                                ROSpecStartTrigger_Parameter(
-                                    ROSpecStartTriggerType=ROSpecStartTriggerType.Immediate
-                                ),
-                                ROSpecStopTrigger_Parameter(
-                                    ROSpecStopTriggerType=ROSpecStopTriggerType.Null
-                                )
-                            ]),
-                            AISpec_Parameter(
-                                AntennaIDs=self.ANTENNA_IDS,
-                                Parameters=[
-                                    AISpecStopTrigger_Parameter(
-                                        AISpecStopTriggerType=AISpecStopTriggerType.Null
-                                    ),
-                                    InventoryParameterSpec_Parameter(
-                                        InventoryParameterSpecID=self.INVENTORY_PARAM_ID,
-                                        ProtocolID=AirProtocols.EPCGlobalClass1Gen2
-                                    )
-                                ]
-                            ),
-                            ROReportSpec_Parameter(
-                                ROReportTrigger=ROReportTriggerType.Upon_N_Tags_Or_End_Of_ROSpec,
-                                N=self.REPORT_N_VALUE,
-                                Parameters=[
-                                    TagReportContentSelector_Parameter(
-                                        EnableAntennaID=True,
-                                        EnableFirstSeenTimestamp=True,
-                                        EnablePeakRSSI=True
-                                    )
-                                ]
-                            )
-                        ]
-                    )
-                ]
-            )
-            
-            response = self.connector.transact(rospec_msg)
-            if response.success():
-                logger.info("✅ ROSpec 추가 성공")
-                return True
-            else:
-                logger.error(f"❌ ROSpec 추가 실패: {response}")
-                return False
-                
-        except Exception as e:
-            logger.error(f"❌ ROSpec 생성 오류: {e}")
-            return False
-    
-    def step5_enable_rospec(self):
-        """5단계: ROSpec 활성화"""
-        logger.info("🔛 5. ROSpec 활성화")
-        try:
-            response = self.connector.transact(ENABLE_ROSPEC_Message(ROSpecID=self.ROSPEC_ID))
-            if response.success():
-                logger.info("✅ ROSpec 활성화 완료")
-                return True
-            else:
-                logger.error(f"❌ ROSpec 활성화 실패: {response}")
-                return False
-        except Exception as e:
-            logger.error(f"❌ ROSpec 활성화 오류: {e}")
-            return False
+    def log_pending_tags(self):
+        """핸들러가 쌓아둔 태그들을 로그 레코드 하나로 묶어 출력"""
+        pending = self.pending_tags
+        if not logger.isEnabledFor(logging.INFO):
+            pending.clear()
+            return
+        
+        lines = []
+        add = lines.append
+        while pending:
+            count, epc, antenna_id, rssi = pending.popleft()
+            add(f"🏷️  태그 #{count}: {epc.hex().upper()}\n"
+                f"    📶 RSSI: {rssi} dBm, 📍 안테나: {antenna_id}")
+        if lines:
+            logger.info("\n".join(lines))
     
-    def step6_start_rospec(self):
-        """6단계: ROSpec 시작 (핵심!)"""
-        logger.info("🚀 6. ROSpec 시작 (인벤토리 시작!)")
-        try:
-            response = self.connector.transact(START_ROSPEC_Message(ROSpecID=self.ROSPEC_ID))
-            if response.success():
-                logger.info("✅ ROSpec 시작 - 인벤토리 시작됨!")
-                return True
-            else:
-                logger.error(f"❌ ROSpec 시작 실패: {response}")
-                return False
-        except Exception as e:
-            logger.error(f"❌ ROSpec 시작 오류: {e}")
-            return False
+    def setup_chain(self):
+        """1~6단계: 설정 메시지를 한 번에 전송하고 응답을 순서대로 확인 (왕복 1회)
+        
+        첫 실패에서 중단하고, 이미 전송된 뒤쪽 ROSpec 추가/시작은 되돌림
+        """
+        # (단계, 메시지, 실패시 중단 여부) - 정리 메시지는 지울 Spec이 없으면 실패해도 무방
+        chain = [
+            ("📋 1. GET_READER_CAPABILITIES", GET_READER_CAPABILITIES_Message(), True),
+            ("⚙️  2. 공장 초기화", SET_READER_CONFIG_Message(ResetToFactoryDefault=True), True),
+            ("🧹 3. 기존 ROSpec 비활성화", DISABLE_ROSPEC_Message(ROSpecID=0), False),
+            ("🧹 3. 기존 ROSpec 삭제", DELETE_ROSPEC_Message(ROSpecID=0), False),
+            ("🧹 3. 기존 AccessSpec 삭제", DELETE_ACCESSSPEC_Message(AccessSpecID=0), False),
+            ("📝 4. ROSpec 추가", ADD_ROSPEC_Message(Parameters=[self._rospec]), True),
+            ("🔛 5. ROSpec 활성화", ENABLE_ROSPEC_Message(ROSpecID=self.ROSPEC_ID), True),
+            ("🚀 6. ROSpec 시작 (인벤토리 시작!)", START_ROSPEC_Message(ROSpecID=self.ROSPEC_ID), True),
+        ]
+        
+        return run_setup_chain(self.connector, chain, self.ROSPEC_ID)
     
     def step7_stop_rospec(self):
         """7단계: ROSpec 중지"""
@@ -224,9 +176,11 @@ class FR900CompleteFlow:
         """8단계: 정리 및 연결 해제"""
         logger.info("🧹 8. 정리 및 연결 해제")
         try:
-            # ROSpec 비활성화 및 삭제
-            self.connector.transact(DISABLE_ROSPEC_Message(ROSpecID=self.ROSPEC_ID))
-            self.connector.transact(DELETE_ROSPEC_Message(ROSpecID=self.ROSPEC_ID))
+            # ROSpec 비활성화 및 삭제 - 한 번에 전송
+            transact_batch(self.connector, [
+                DISABLE_ROSPEC_Message(ROSpecID=self.ROSPEC_ID),
+                DELETE_ROSPEC_Message(ROSpecID=self.ROSPEC_ID),
+            ])
             
             # 연결 해제
             self.connector.disconnect()
@@ -248,35 +202,18 @@ class FR900CompleteFlow:
         try:
             # 연결
             self.connector = LLRPConnector()
-            response = self.connector.connect(self.reader_ip)
+            response, self.reader_ip = connect_reader(self.connector.connect, self.reader_ip)
+            tune_reader_socket(self.connector.readerSocket)
             logger.info("✅ 리더 연결 성공")
             
-            # 1단계: GET_READER_CAPABILITIES
-            if not self.step1_get_reader_capabilities():
-                raise Exception("GET_READER_CAPABILITIES 실패")
-            
-            # 2단계: 초기 설정
-            if not self.step2_initial_config():
-                raise Exception("초기 설정 실패")
-            
-            # 3단계: Spec 정리
-            if not self.step3_cleanup_specs():
-                raise Exception("Spec 정리 실패")
-            
-            # 4단계: ROSpec 생성
-            if not self.step4_create_rospec():
-                raise Exception("ROSpec 생성 실패")
-            
-            # 5단계: ROSpec 활성화
-            if not self.step5_enable_rospec():
-                raise Exception("ROSpec 활성화 실패")
-            
-            # 6단계: ROSpec 시작 (실제 인벤토리 시작!)
-            if not self.step6_start_rospec():
-                raise Exception("ROSpec 시작 실패")
+            # 1~6단계: 설정부터 ROSpec 시작까지 한 번에 전송
+            if not self.setup_chain():
+                raise Exception("리더 설정 실패")
             
             # 핸들러 등록
             self.tag_count = 0
+            self.pending_tags.clear()
+            self.seen_epcs.clear()
             self.connector.addHandler(RO_ACCESS_REPORT_Message, self.access_report_handler)
             logger.info("✅ 이벤트 핸들러 등록 완료")
             
@@ -288,17 +225,23 @@ class FR900CompleteFlow:
             logger.info(f"🔄 {duration}초 동안 태그 읽기 중...")
             logger.info("📋 태그를 리더에 가져다 대세요!")
             
-            start_time = time.time()
-            last_report = start_time
+            start_time = time.monotonic()
+            deadline = start_time + duration
+            next_report = start_time + 2
             
-            while (time.time() - start_time) < duration:
-                current = time.time()
-                if current - last_report >= 2:
-                    elapsed = current - start_time
-                    remaining = duration - elapsed
-                    logger.info(f"⏳ {elapsed:.1f}초 경과, {remaining:.1f}초 남음 (태그 {self.tag_count}개)")
-                    last_report = current
-                time.sleep(0.1)
+            # 태그는 리스너가 처리 - 메인 스레드는 1초마다 깨어나 로그만 출력
+            try:
+                now = start_time
+                while now < deadline and not self._stop.wait(min(1.0, deadline - now)):
+                    self.log_pending_tags()
+                    
+                    now = time.monotonic()
+                    if now >= next_report:
+                        logger.info(f"⏳ {now - start_time:.1f}초 경과, {max(0.0, deadline - now):.1f}초 남음 (태그 {self.tag_count}개)")
+                        next_report = now + 2
+            except KeyboardInterrupt:
+                # Ctrl+C는 읽기만 끝내고 ROSpec 중지/정리는 그대로 진행
+                logger.info("🛑 사용자 중지 - 태그 읽기 종료")
             
             # 7단계: ROSpec 중지
             if not self.step7_stop_rospec():
@@ -307,25 +250,29 @@ class FR900CompleteFlow:
             # 리스너 중지
             self.connector.stopListener()
             logger.info("🎧 이벤트 리스너 중지")
+            self.log_pending_tags()
             
             # 8단계: 정리
             if not self.step8_cleanup_and_disconnect():
                 logger.warning("정리 과정 실패")
             
             # 결과
-            elapsed = time.time() - start_time
-            logger.info("=" * 80)
-            logger.info("📊 완전한 플로우 태그 읽기 결과")
-            logger.info(f"⏱️  실행 시간: {elapsed:.1f}초")
-            logger.info(f"🏷️  읽은 태그 수: {self.tag_count}개")
-            logger.info("🎯 방식: 실제 성공 과정 완전 재현")
+            elapsed = time.monotonic() - start_time
+            report = [
+                "📊 완전한 플로우 태그 읽기 결과",
+                f"⏱️  실행 시간: {elapsed:.1f}초",
+                f"🏷️  읽은 태그 수: {self.tag_count}개 (고유 EPC {len(self.seen_epcs)}개)",
+                "🎯 방식: 실제 성공 과정 완전 재현",
+            ]
             
             if self.tag_count > 0:
-                logger.info(f"📈 읽기 속도: {self.tag_count/elapsed:.1f} 태그/초")
-                logger.info("🎉 완전한 플로우로 태그 읽기 성공!")
+                report.append(f"📈 읽기 속도: {self.tag_count/elapsed:.1f} 태그/초")
+                report.append("🎉 완전한 플로우로 태그 읽기 성공!")
+                logger.info("\n".join(report))
                 return True
             else:
-                logger.warning("⚠️ 읽은 태그가 없습니다")
+                report.append("⚠️ 읽은 태그가 없습니다")
+                logger.warning("\n".join(report))
                 return False
                 
         except Exception as e:
@@ -346,17 +293,8 @@ def main():
     print("📋 GET_READER_CAPABILITIES → START_ROSPEC 포함")
     print()
     
-    # AutoDetect로 리더 찾기
-    try:
-        reader_ip, computer_ip = AutoDetect()
-        if reader_ip:
-            print(f"🔍 리더 자동 탐지: {reader_ip}")
-        else:
-            reader_ip = "192.168.10.102"
-            print(f"🔍 기본 리더 IP 사용: {reader_ip}")
-    except:
-        reader_ip = "192.168.10.102"
-        print(f"🔍 기본 리더 IP 사용: {reader_ip}")
+    # 저장된 IP → AutoDetect → 기본 IP 순으로 리더 찾기
+    reader_ip = find_reader_ip()
     
     # 실행 시간 선택
     durations = [10, 20, 30]
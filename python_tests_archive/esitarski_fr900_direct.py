@@ -17,19 +17,33 @@ sys.path.insert(0, 'esitarski_pyllrp')
 
 try:
     from esitarski_pyllrp.pyllrp.TagInventory import TagInventory
-    from esitarski_pyllrp.pyllrp.AutoDetect import AutoDetect
-    from esitarski_pyllrp.pyllrp.pyllrp import HexFormatToStr
 except ImportError as e:
     print(f"esitarski/pyllrp 라이브러리를 찾을 수 없습니다: {e}")
     sys.exit(1)
 
+from esitarski_fr900_common import (
+    CachedTimeFormatter, connect_reader, find_reader_ip, tune_reader_socket
+)
+
+
 # 로깅 설정
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(CachedTimeFormatter('%(asctime)s - %(levelname)s - %(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+    handlers=[_log_handler]
 )
 logger = logging.getLogger(__name__)
 
+
+def empty_read_backoff(empty_streak):
+    """연속으로 태그가 없을 때의 대기 시간 - 0.2초부터 두 배씩, 최대 2초
+    
+    태그를 읽은 직후에는 기다리지 않고 바로 다음 인벤토리를 실행
+    """
+    return min(2.0, 0.1 * (1 << min(empty_streak, 5)))
+
+
 class FR900DirectInventory:
     """FR900용 직접 TagInventory 사용"""
     
@@ -37,17 +51,40 @@ class FR900DirectInventory:
         self.reader_ip = reader_ip
         self.total_reads = 0
         self.unique_tags = set()
+        self.ti = None
+    
+    def _open_session(self):
+        """테스트 간 공유하는 리더 연결 - 한 번만 연결하고 재사용"""
+        if self.ti is None:
+            logger.info(f"📡 리더 {self.reader_ip}에 연결 중...")
+            ti, self.reader_ip = connect_reader(self._connect_inventory, self.reader_ip)
+            tune_reader_socket(ti.connector.readerSocket)
+            self.ti = ti
+        return self.ti
+    
+    @staticmethod
+    def _connect_inventory(reader_ip):
+        """TagInventory 생성 후 연결"""
+        ti = TagInventory(host=reader_ip)
+        ti.Connect()
+        return ti
+    
+    def _close_session(self):
+        """재사용 중인 리더 연결 해제"""
+        if self.ti is not None:
+            try:
+                self.ti.Disconnect()
+            except Exception as e:
+                logger.warning(f"연결 해제 중 오류: {e}")
+            self.ti = None
         
     def simple_read_once(self):
         """가장 간단한 한번 읽기"""
         logger.info("=== 기본 태그 인벤토리 (한번 읽기) ===")
         
         try:
-            # 기본 설정으로 TagInventory 생성 - 아무 설정 없이
-            ti = TagInventory(host=self.reader_ip)
-            
-            logger.info(f"📡 리더 {self.reader_ip}에 연결 중...")
-            ti.Connect()
+            # 기본 설정 연결 - 이후 테스트에서도 그대로 재사용
+            ti = self._open_session()
             logger.info("✅ 연결 성공")
             
             logger.info("🔄 태그 인벤토리 실행 중...")
@@ -56,22 +93,19 @@ class FR900DirectInventory:
             logger.info(f"📊 결과: {len(tag_inventory)}개 태그 발견")
             
             if tag_inventory:
-                logger.info("🏷️  발견된 EPC 값들:")
-                for i, epc in enumerate(tag_inventory, 1):
-                    logger.info(f"   {i}. {epc}")
-                    self.unique_tags.add(epc)
+                self.unique_tags.update(tag_inventory)
+                
+                # 태그마다 로그를 남기지 않고 한 번에 출력
+                lines = [f"   {i}. {epc}" for i, epc in enumerate(tag_inventory, 1)]
+                logger.info("🏷️  발견된 EPC 값들:\n" + "\n".join(lines))
                 
                 # 상세 정보도 출력
                 if ti.tagDetail:
-                    logger.info("📝 상세 태그 정보:")
-                    for i, detail in enumerate(ti.tagDetail, 1):
-                        epc = detail.get('Tag', 'Unknown')
-                        antenna = detail.get('AntennaID', 'N/A')  
-                        rssi = detail.get('PeakRSSI', 'N/A')
-                        timestamp = detail.get('FirstSeenTimestampUTC', 'N/A')
-                        
-                        logger.info(f"   태그 {i}: EPC={epc}")
-                        logger.info(f"            안테나={antenna}, RSSI={rssi}")
+                    lines = [f"   태그 {i}: EPC={detail.get('Tag', 'Unknown')}\n"
+                             f"            안테나={detail.get('AntennaID', 'N/A')}, "
+                             f"RSSI={detail.get('PeakRSSI', 'N/A')}"
+                             for i, detail in enumerate(ti.tagDetail, 1)]
+                    logger.info("📝 상세 태그 정보:\n" + "\n".join(lines))
                 
                 success = True
             else:
@@ -82,13 +116,11 @@ class FR900DirectInventory:
             if other_messages:
                 logger.info(f"📩 기타 메시지: {len(other_messages)}개")
             
-            ti.Disconnect()
-            logger.info("✅ 연결 해제 완료")
-            
             return success
             
         except Exception as e:
             logger.error(f"❌ 태그 읽기 실패: {e}")
+            self._close_session()
             return False
     
     def read_with_power_levels(self):
@@ -97,9 +129,15 @@ class FR900DirectInventory:
         
         power_levels = [20, 30, 50]  # 낮은 파워부터 시도
         
-        for power in power_levels:
+        # 전송 파워는 연결 시 설정되므로 파워마다 별도 연결 - 공유 연결은 먼저 닫음
+        self._close_session()
+        
+        for i, power in enumerate(power_levels):
             logger.info(f"🔋 전송 파워 {power} 테스트 중...")
             
+            if i:
+                time.sleep(1)  # 이전 연결 해제 후 잠깐 대기
+            
             try:
                 ti = TagInventory(
                     host=self.reader_ip,
@@ -107,8 +145,11 @@ class FR900DirectInventory:
                 )
                 
                 ti.Connect()
-                tag_inventory, _ = ti.GetTagInventory()
-                ti.Disconnect()
+                try:
+                    tag_inventory, _ = ti.GetTagInventory()
+                finally:
+                    # 읽기가 실패해도 연결은 닫아야 다음 파워에서 다시 연결 가능
+                    ti.Disconnect()
                 
                 if tag_inventory:
                     logger.info(f"✅ 전력 {power}: {len(tag_inventory)}개 태그 발견")
@@ -119,8 +160,6 @@ class FR900DirectInventory:
                 else:
                     logger.info(f"⚠️ 전력 {power}: 태그 없음")
                 
-                time.sleep(1)  # 잠깐 대기
-                
             except Exception as e:
                 logger.error(f"전력 {power} 테스트 실패: {e}")
         
@@ -131,29 +170,31 @@ class FR900DirectInventory:
         logger.info(f"=== {attempts}번 반복 시도 ===")
         
         success_count = 0
+        empty_streak = 0
         
+        # 공유 연결 사용 - 매 시도마다 재연결/초기화하지 않음
         for attempt in range(1, attempts + 1):
             logger.info(f"🔄 시도 {attempt}/{attempts}")
             
             try:
-                ti = TagInventory(host=self.reader_ip)
-                ti.Connect()
+                ti = self._open_session()
                 tag_inventory, _ = ti.GetTagInventory()
-                ti.Disconnect()
                 
                 if tag_inventory:
                     success_count += 1
+                    empty_streak = 0
                     logger.info(f"✅ 시도 {attempt}: {len(tag_inventory)}개 태그 발견")
                     for epc in tag_inventory:
                         logger.info(f"   📡 EPC: {epc}")
                         self.unique_tags.add(epc)
                 else:
                     logger.info(f"⚠️ 시도 {attempt}: 태그 없음")
-                
-                time.sleep(2)  # 시도 간 대기
+                    empty_streak += 1
+                    time.sleep(empty_read_backoff(empty_streak))
                 
             except Exception as e:
                 logger.error(f"시도 {attempt} 실패: {e}")
+                self._close_session()  # 다음 시도에서 새로 연결
         
         logger.info(f"📊 결과: {attempts}번 중 {success_count}번 성공")
         logger.info(f"🏷️  총 고유 태그 수: {len(self.unique_tags)}")
@@ -164,38 +205,42 @@ class FR900DirectInventory:
         """연속 모니터링"""
         logger.info(f"=== {duration}초 연속 모니터링 ===")
         
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = start_time + duration
         attempt_count = 0
         success_count = 0
+        empty_streak = 0
         
-        while (time.time() - start_time) < duration:
+        # 하나의 연결에서 인벤토리를 연달아 실행 (읽기 사이 대기 없음)
+        now = start_time
+        while now < deadline:
             attempt_count += 1
-            elapsed = time.time() - start_time
-            
-            logger.info(f"🔄 읽기 {attempt_count} (경과: {elapsed:.1f}초)")
+            logger.info(f"🔄 읽기 {attempt_count} (경과: {now - start_time:.1f}초)")
             
             try:
-                ti = TagInventory(host=self.reader_ip)
-                ti.Connect()
+                ti = self._open_session()
                 tag_inventory, _ = ti.GetTagInventory()
-                ti.Disconnect()
                 
                 if tag_inventory:
                     success_count += 1
+                    empty_streak = 0
                     logger.info(f"✅ {len(tag_inventory)}개 태그 발견!")
                     for epc in tag_inventory:
                         logger.info(f"   📡 EPC: {epc}")
                         self.unique_tags.add(epc)
                 else:
                     logger.info("⚠️ 이번엔 태그 없음")
-                
-                time.sleep(3)  # 3초 간격
+                    empty_streak += 1
+                    time.sleep(empty_read_backoff(empty_streak))
                 
             except Exception as e:
                 logger.error(f"읽기 {attempt_count} 실패: {e}")
+                self._close_session()  # 다음 읽기에서 새로 연결
                 time.sleep(5)  # 오류시 더 오래 대기
+            
+            now = time.monotonic()
         
-        total_time = time.time() - start_time
+        total_time = time.monotonic() - start_time
         logger.info(f"📊 연속 모니터링 완료:")
         logger.info(f"   총 시간: {total_time:.1f}초")
         logger.info(f"   총 시도: {attempt_count}번")
@@ -210,17 +255,8 @@ def main():
     print("FR900 esitarski/pyllrp Direct TagInventory 테스트")
     print("===============================================")
     
-    # AutoDetect로 리더 찾기
-    try:
-        reader_ip, computer_ip = AutoDetect()
-        if reader_ip:
-            print(f"🔍 리더 자동 탐지: {reader_ip}")
-        else:
-            reader_ip = "192.168.10.102"
-            print(f"🔍 기본 리더 IP 사용: {reader_ip}")
-    except:
-        reader_ip = "192.168.10.102"
-        print(f"🔍 기본 리더 IP 사용: {reader_ip}")
+    # 저장된 IP → AutoDetect → 기본 IP 순으로 리더 찾기
+    reader_ip = find_reader_ip()
     
     # 테스트 실행
     inventory = FR900DirectInventory(reader_ip)
@@ -253,6 +289,9 @@ def main():
         
         time.sleep(3)  # 테스트 간 대기
     
+    # 테스트들이 공유한 연결은 마지막에 한 번만 해제
+    inventory._close_session()
+    
     # 최종 결과
     logger.info(f"\n{'='*60}")
     logger.info("🎯 최종 결과:")
@@ -24,13 +24,13 @@ except ImportError as e:
     print(f"esitarski/pyllrp 라이브러리를 찾을 수 없습니다: {e}")
     sys.exit(1)
 
+from esitarski_fr900_common import epc_hex, setup_queue_logging, tune_reader_socket
+
 # 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+setup_queue_logging()
 logger = logging.getLogger(__name__)
 
+
 class FR900EsitarskiFinal:
     """FR900용 esitarski/pyllrp 최종 구현"""
     
@@ -40,24 +40,42 @@ class FR900EsitarskiFinal:
         self.tag_count = 0
         self.rospec_id = 0x04D2  # 1234
         
+        # ADD_ROSPEC는 MessageID까지 고정이라 매 테스트 같은 메시지 - 한 번만 생성
+        self._add_rospec_msg = self.create_minimal_rospec()
+    
+    def _ensure_connected(self):
+        """테스트 간 공유하는 리더 연결 - 처음 한 번만 연결"""
+        if self.connector is None:
+            connector = LLRPConnector()
+            response = connector.connect(self.reader_ip)
+            tune_reader_socket(connector.readerSocket)
+            self.connector = connector
+            logger.info("✅ 리더 연결 성공")
+            logger.info(f"연결 응답: {response}")
+        return self.connector
+    
+    def close(self):
+        """공유 연결 해제 - main에서 모든 테스트가 끝난 뒤 호출"""
+        if self.connector is not None:
+            try:
+                self.connector.disconnect()
+            except Exception as e:
+                logger.warning(f"연결 해제 중 오류: {e}")
+            self.connector = None
+        
     def access_report_handler(self, connector, access_report):
         """RO_ACCESS_REPORT 메시지 핸들러"""
         try:
+            log_tags = logger.isEnabledFor(logging.INFO)
             for tag_data in access_report.getTagData():
                 self.tag_count += 1
-                epc = HexFormatToStr(tag_data['EPC'])
-                
-                # 기본 정보 추출
-                info = {
-                    'count': self.tag_count,
-                    'epc': epc,
-                    'antenna_id': tag_data.get('AntennaID', 'N/A'),
-                    'rssi': tag_data.get('PeakRSSI', 'N/A'),
-                    'timestamp': tag_data.get('FirstSeenTimestampUTC', 'N/A')
-                }
+                if not log_tags:
+                    continue  # 로그가 꺼져 있으면 개수만 셈
                 
-                logger.info(f"🏷️  태그 #{info['count']}: EPC={info['epc']}")
-                logger.info(f"    안테나={info['antenna_id']}, RSSI={info['rssi']} dBm")
+                # 태그당 로그 레코드 하나 - 포맷은 출력될 때만
+                logger.info("🏷️  태그 #%d: EPC=%s\n    안테나=%s, RSSI=%s dBm",
+                            self.tag_count, epc_hex(tag_data['EPC']),
+                            tag_data.get('AntennaID', 'N/A'), tag_data.get('PeakRSSI', 'N/A'))
                 
                 # TV 파라미터에서 추가 RSSI 정보 추출 (FR900 특화)
                 self.extract_tv_parameters(access_report)
@@ -131,45 +149,38 @@ class FR900EsitarskiFinal:
         """기본 연결 테스트"""
         logger.info("=== 기본 연결 테스트 ===")
         try:
-            self.connector = LLRPConnector()
-            response = self.connector.connect(self.reader_ip)
-            logger.info("✅ 리더 연결 성공")
-            logger.info(f"연결 응답: {response}")
-            self.connector.disconnect()
+            self._ensure_connected()
             return True
         except Exception as e:
             logger.error(f"연결 실패: {e}")
+            self.close()
             return False
     
     def test_factory_reset_only(self):
         """공장 초기화만 테스트"""
         logger.info("=== 공장 초기화 테스트 ===")
         try:
-            self.connector = LLRPConnector()
-            self.connector.connect(self.reader_ip)
+            connector = self._ensure_connected()
             
             # 공장 초기화
-            response = self.connector.transact(SET_READER_CONFIG_Message(ResetToFactoryDefault=True))
+            response = connector.transact(SET_READER_CONFIG_Message(ResetToFactoryDefault=True))
             if response.success():
                 logger.info("✅ 공장 초기화 성공")
-                result = True
+                return True
             else:
                 logger.error(f"❌ 공장 초기화 실패: {response}")
-                result = False
-            
-            self.connector.disconnect()
-            return result
+                return False
             
         except Exception as e:
             logger.error(f"공장 초기화 테스트 실패: {e}")
+            self.close()
             return False
     
     def test_rospec_add_only(self):
         """ROSpec 추가만 테스트"""
         logger.info("=== ROSpec 추가 테스트 ===")
         try:
-            self.connector = LLRPConnector()
-            self.connector.connect(self.reader_ip)
+            self._ensure_connected()
             
             # 공장 초기화
             response = self.connector.transact(SET_READER_CONFIG_Message(ResetToFactoryDefault=True))
@@ -182,7 +193,7 @@ class FR900EsitarskiFinal:
             self.connector.transact(DELETE_ROSPEC_Message(ROSpecID=self.rospec_id))
             
             # ROSpec 생성 및 추가
-            rospec_msg = self.create_minimal_rospec()
+            rospec_msg = self._add_rospec_msg
             if not rospec_msg:
                 logger.error("ROSpec 생성 실패")
                 return False
@@ -198,11 +209,11 @@ class FR900EsitarskiFinal:
                 logger.error(f"❌ ROSpec 추가 실패: {response}")
                 result = False
             
-            self.connector.disconnect()
             return result
             
         except Exception as e:
             logger.error(f"ROSpec 추가 테스트 실패: {e}")
+            self.close()
             return False
     
     def test_full_inventory_cycle(self, duration=5):
@@ -210,10 +221,8 @@ class FR900EsitarskiFinal:
         logger.info(f"=== {duration}초 전체 인벤토리 테스트 ===")
         
         try:
-            # 1. 연결
-            self.connector = LLRPConnector()
-            response = self.connector.connect(self.reader_ip)
-            logger.info("✅ 리더 연결 성공")
+            # 1. 연결 (앞 테스트의 연결 재사용)
+            self._ensure_connected()
             
             # 2. 공장 초기화
             response = self.connector.transact(SET_READER_CONFIG_Message(ResetToFactoryDefault=True))
@@ -228,7 +237,7 @@ class FR900EsitarskiFinal:
             logger.info("✅ 기존 ROSpec 정리 완료")
             
             # 4. ROSpec 추가
-            rospec_msg = self.create_minimal_rospec()
+            rospec_msg = self._add_rospec_msg
             if not rospec_msg:
                 logger.error("ROSpec 생성 실패")
                 return False
@@ -265,9 +274,6 @@ class FR900EsitarskiFinal:
             self.connector.transact(DISABLE_ROSPEC_Message(ROSpecID=self.rospec_id))
             self.connector.transact(DELETE_ROSPEC_Message(ROSpecID=self.rospec_id))
             
-            # 연결 해제
-            self.connector.disconnect()
-            
             elapsed = time.time() - start_time
             logger.info(f"✅ 테스트 완료: {elapsed:.1f}초 동안 {self.tag_count}개 태그 읽음")
             
@@ -282,9 +288,10 @@ class FR900EsitarskiFinal:
             logger.error(f"❌ 전체 인벤토리 테스트 실패: {e}")
             if self.connector:
                 try:
-                    self.connector.disconnect()
-                except:
+                    self.connector.stopListener()
+                except Exception:
                     pass
+            self.close()
             return False
 
 def main():
@@ -332,6 +339,9 @@ def main():
         
         time.sleep(2)  # 테스트 간 대기
     
+    # 테스트들이 공유한 연결은 마지막에 한 번만 해제
+    tester.close()
+    
     # 최종 결과
     logger.info(f"\n{'='*60}")
     logger.info("최종 테스트 결과:")
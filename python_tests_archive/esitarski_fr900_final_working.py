@@ -7,6 +7,7 @@ esitarski/pyllrp의 검증된 방식을 활용하되 START_ROSPEC을 추가하
 """
 
 import sys
+import threading
 import time
 import logging
 from datetime import datetime
@@ -23,13 +24,13 @@ except ImportError as e:
     print(f"esitarski/pyllrp 라이브러리를 찾을 수 없습니다: {e}")
     sys.exit(1)
 
+from esitarski_fr900_common import epc_hex, setup_queue_logging, tune_reader_socket
+
 # 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+setup_queue_logging()
 logger = logging.getLogger(__name__)
 
+
 class FR900FinalWorking:
     """FR900용 최종 작동 버전 - esitarski 검증 방식 + START_ROSPEC"""
     
@@ -37,6 +38,7 @@ class FR900FinalWorking:
         self.reader_ip = reader_ip
         self.tag_count = 0
         self.found_tags = set()
+        self._first_tag = threading.Event()  # 첫 태그 수신 시 set
         
     def method1_use_taginventory_directly(self):
         """방법1: esitarski TagInventory를 그대로 사용"""
@@ -45,25 +47,29 @@ class FR900FinalWorking:
         logger.info("=" * 60)
         
         try:
-            # 여러 파워 레벨로 시도
-            power_levels = [10, 20, 30, 50]
+            # 중간 파워부터 시도하고, 태그가 없을 때만 낮은/높은 파워로 넓혀감
+            power_levels = [30, 10, 50, 20]
+            attempts = 3
             
             for power in power_levels:
                 logger.info(f"🔋 전송 파워 {power}으로 시도 중...")
                 
+                # 파워는 Connect 시 SET_READER_CONFIG로 적용되므로 레벨마다 새로 연결
+                ti = TagInventory(
+                    host=self.reader_ip,
+                    transmitPower=power,
+                    receiverSensitivity=1
+                )
+                
                 try:
-                    ti = TagInventory(
-                        host=self.reader_ip,
-                        transmitPower=power,
-                        receiverSensitivity=1
-                    )
-                    
                     ti.Connect()
+                    tune_reader_socket(ti.connector.readerSocket)
                     logger.info("✅ TagInventory 연결 성공")
                     
-                    # 여러 번 시도
-                    for attempt in range(3):
-                        logger.info(f"📡 시도 {attempt+1}/3")
+                    # 같은 연결로 재시도하며 대기 시간은 0.25초부터 두 배씩
+                    backoff = 0.25
+                    for attempt in range(attempts):
+                        logger.info(f"📡 시도 {attempt+1}/{attempts}")
                         tag_inventory, other_messages = ti.GetTagInventory()
                         
                         if tag_inventory:
@@ -80,18 +86,20 @@ class FR900FinalWorking:
                                     antenna = detail.get('AntennaID', 'N/A')
                                     logger.info(f"   📊 {epc}: RSSI={rssi}, 안테나={antenna}")
                             
-                            ti.Disconnect()
                             return True
-                        else:
-                            logger.info("⚠️ 이번 시도에서는 태그 없음")
                         
-                        time.sleep(1)
-                    
-                    ti.Disconnect()
+                        logger.info("⚠️ 이번 시도에서는 태그 없음")
+                        if attempt < attempts - 1:
+                            time.sleep(backoff)
+                            backoff *= 2
                     
                 except Exception as e:
                     logger.error(f"전력 {power} 시도 실패: {e}")
-                    continue
+                finally:
+                    try:
+                        ti.Disconnect()
+                    except Exception:
+                        pass
             
             return len(self.found_tags) > 0
             
@@ -108,12 +116,9 @@ class FR900FinalWorking:
         try:
             connector = LLRPConnector()
             connector.connect(self.reader_ip)
+            tune_reader_socket(connector.readerSocket)
             logger.info("✅ 수동 연결 성공")
             
-            # GET_READER_CAPABILITIES
-            response = connector.transact(GET_READER_CAPABILITIES_Message())
-            logger.info("✅ GET_READER_CAPABILITIES 완료")
-            
             # 공장 초기화
             response = connector.transact(SET_READER_CONFIG_Message(ResetToFactoryDefault=True))
             logger.info("✅ 공장 초기화 완료")
@@ -193,27 +198,28 @@ class FR900FinalWorking:
                 try:
                     for tag_data in msg.getTagData():
                         self.tag_count += 1
-                        epc = HexFormatToStr(tag_data['EPC'])
-                        rssi = tag_data.get('PeakRSSI', 'N/A')
-                        antenna = tag_data.get('AntennaID', 'N/A')
-                        
-                        logger.info(f"🏷️  태그 #{self.tag_count}: {epc}")
-                        logger.info(f"    📶 RSSI: {rssi} dBm, 📍 안테나: {antenna}")
+                        epc = epc_hex(tag_data['EPC'])
                         self.found_tags.add(epc)
+                        self._first_tag.set()
+                        
+                        # 태그당 로그 레코드 하나 - 포맷은 출력될 때만
+                        logger.info("🏷️  태그 #%d: %s\n    📶 RSSI: %s dBm, 📍 안테나: %s",
+                                    self.tag_count, epc,
+                                    tag_data.get('PeakRSSI', 'N/A'), tag_data.get('AntennaID', 'N/A'))
                 except Exception as e:
                     logger.error(f"태그 처리 오류: {e}")
             
+            self._first_tag.clear()
             connector.addHandler(RO_ACCESS_REPORT_Message, access_handler)
             
             # 리스너 시작
             connector.startListener()
             logger.info("🎧 리스너 시작")
             
-            # 10초 대기
-            logger.info("🔄 10초 동안 대기 중...")
-            for i in range(10):
-                logger.info(f"⏳ {i+1}/10초 - 태그 {self.tag_count}개")
-                time.sleep(1)
+            # 최대 10초 대기 - START_ROSPEC 동작 확인이 목적이므로 첫 태그가 읽히면 바로 종료
+            logger.info("🔄 최대 10초 동안 대기 중...")
+            if not self._first_tag.wait(10):
+                logger.info("⏳ 10초 동안 태그 없음")
             
             # 정리
             connector.stopListener()
@@ -8,6 +8,7 @@ FR900 with esitarski/pyllrp - Protocol Correct Version
 """
 
 import sys
+import threading
 import time
 import logging
 from datetime import datetime
@@ -23,6 +24,8 @@ except ImportError as e:
     print(f"esitarski/pyllrp 라이브러리를 찾을 수 없습니다: {e}")
     sys.exit(1)
 
+from esitarski_fr900_common import run_setup_chain
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -37,6 +40,8 @@ class FR900ProtocolCorrect:
         self.reader_ip = reader_ip
         self.connector = None
         self.tag_count = 0
+        self._stop = threading.Event()  # 읽기 대기용 - 시간 제한까지 블록
+        self._epc_cache = {}  # 원본 EPC -> 16진수 문자열 (같은 태그는 한 번만 포맷)
         
         # 성공한 패킷에서 추출한 핵심 값들
         self.ROSPEC_ID = 1234                    # 0x04D2
@@ -44,25 +49,29 @@ class FR900ProtocolCorrect:
         self.ANTENNA_IDS = [1]                   # 안테나 1번
         self.REPORT_N_VALUE = 1                  # N=1 (즉시 보고)
         
+    def _epc_str(self, raw):
+        """EPC 16진수 문자열 - 이미 본 EPC는 캐시에서 바로 반환"""
+        try:
+            epc = self._epc_cache.get(raw)
+        except TypeError:  # 해시 불가능한 형식이면 캐시 없이 포맷
+            return HexFormatToStr(raw)
+        if epc is None:
+            epc = self._epc_cache[raw] = HexFormatToStr(raw)
+        return epc
+    
     def access_report_handler(self, connector, access_report):
         """RO_ACCESS_REPORT 메시지 핸들러"""
         try:
+            log_tags = logger.isEnabledFor(logging.INFO)
             for tag_data in access_report.getTagData():
                 self.tag_count += 1
-                epc = HexFormatToStr(tag_data['EPC'])
+                if not log_tags:
+                    continue  # 로그가 꺼져 있으면 개수만 셈
                 
-                info = {
-                    'count': self.tag_count,
-                    'epc': epc,
-                    'antenna_id': tag_data.get('AntennaID', 'N/A'),
-                    'rssi': tag_data.get('PeakRSSI', 'N/A'),
-                    'timestamp': tag_data.get('FirstSeenTimestampUTC', 'N/A'),
-                    'seen_count': tag_data.get('TagSeenCount', 'N/A')
-                }
-                
-                logger.info(f"🏷️  태그 #{info['count']}: {info['epc']}")
-                logger.info(f"    📶 RSSI: {info['rssi']} dBm")
-                logger.info(f"    📍 안테나: {info['antenna_id']}")
+                # %-포맷 인자로 넘겨 문자열 조립은 로깅 쪽에서 한 번만
+                logger.info("🏷️  태그 #%d: %s", self.tag_count, self._epc_str(tag_data['EPC']))
+                logger.info("    📶 RSSI: %s dBm", tag_data.get('PeakRSSI', 'N/A'))
+                logger.info("    📍 안테나: %s", tag_data.get('AntennaID', 'N/A'))
                 
         except Exception as e:
             logger.error(f"태그 데이터 처리 중 오류: {e}")
@@ -77,8 +86,8 @@ class FR900ProtocolCorrect:
             logger.info(f"   리포트 N값: {self.REPORT_N_VALUE}")
             
             # 성공한 패킷의 정확한 구조를 esitarski/pyllrp로 재현
+            # MessageID는 지정하지 않음 - 한 번에 보내는 메시지끼리 ID가 겹치면 응답을 구분 못 함
             rospec_msg = ADD_ROSPEC_Message(
-                MessageID=1,  # 메시지 ID는 자동으로 설정됨
                 Parameters=[
                     ROSpec_Parameter(
                         ROSpecID=self.ROSPEC_ID,
@@ -151,59 +160,45 @@ class FR900ProtocolCorrect:
             response = self.connector.connect(self.reader_ip)
             logger.info("✅ 리더 연결 성공")
             
-            # 2. 공장 초기화
-            response = self.connector.transact(SET_READER_CONFIG_Message(ResetToFactoryDefault=True))
-            if not response.success():
-                raise Exception(f"공장 초기화 실패: {response}")
-            logger.info("✅ 공장 초기화 완료")
-            
-            # 3. 기존 ROSpec 정리
-            self.connector.transact(DISABLE_ROSPEC_Message(ROSpecID=0))
-            self.connector.transact(DELETE_ROSPEC_Message(ROSpecID=self.ROSPEC_ID))
-            logger.info("✅ 기존 ROSpec 정리 완료")
-            
-            # 4. 프로토콜 준수 ROSpec 추가
+            # 2~4. 공장 초기화, 기존 ROSpec 정리, ROSpec 추가/활성화를 한 번에 전송
             rospec_msg = self.create_protocol_correct_rospec()
             if not rospec_msg:
                 raise Exception("ROSpec 생성 실패")
             
-            logger.info("📤 프로토콜 준수 ROSpec 전송 중...")
-            response = self.connector.transact(rospec_msg)
-            if not response.success():
-                logger.error(f"❌ ROSpec 응답: {response}")
-                raise Exception(f"ROSpec 추가 실패: {response}")
-            logger.info("✅ 프로토콜 준수 ROSpec 추가 성공!")
+            # (단계, 메시지, 실패시 중단 여부) - 정리 메시지는 지울 Spec이 없으면 실패해도 무방
+            chain = [
+                ("공장 초기화", SET_READER_CONFIG_Message(ResetToFactoryDefault=True), True),
+                ("기존 ROSpec 비활성화", DISABLE_ROSPEC_Message(ROSpecID=0), False),
+                ("기존 ROSpec 삭제", DELETE_ROSPEC_Message(ROSpecID=self.ROSPEC_ID), False),
+                ("ROSpec 추가", rospec_msg, True),
+                ("ROSpec 활성화", ENABLE_ROSPEC_Message(ROSpecID=self.ROSPEC_ID), True),
+            ]
             
-            # 5. 이벤트 핸들러 등록
+            logger.info("📤 설정 메시지 및 프로토콜 준수 ROSpec 전송 중...")
+            if not run_setup_chain(self.connector, chain, self.ROSPEC_ID):
+                raise Exception("리더 설정 실패")
+            
+            # 5. 이벤트 핸들러 등록 - 리포트는 리스너 시작 후에야 전달됨
             self.tag_count = 0
             self.connector.addHandler(RO_ACCESS_REPORT_Message, self.access_report_handler)
             logger.info("✅ EPC 읽기 핸들러 등록 완료")
             
-            # 6. ROSpec 활성화
-            response = self.connector.transact(ENABLE_ROSPEC_Message(ROSpecID=self.ROSPEC_ID))
-            if not response.success():
-                raise Exception(f"ROSpec 활성화 실패: {response}")
-            logger.info("✅ ROSpec 활성화 완료")
-            
-            # 7. 리스너 시작 및 태그 읽기
+            # 6. 리스너 시작 및 태그 읽기
             logger.info(f"🔄 {duration}초 동안 프로토콜 준수 방식으로 EPC 읽기...")
             logger.info("📋 태그를 리더 근처에 가져다 대세요!")
             
             self.connector.startListener()
-            start_time = time.time()
+            start_time = time.monotonic()
+            deadline = start_time + duration
             
-            # 진행 상황 표시
-            last_report = start_time
-            while (time.time() - start_time) < duration:
-                current = time.time()
-                if current - last_report >= 3:
-                    elapsed = current - start_time
-                    remaining = duration - elapsed
-                    logger.info(f"⏳ {elapsed:.1f}초 경과, {remaining:.1f}초 남음 (태그 {self.tag_count}개)")
-                    last_report = current
-                time.sleep(0.1)
+            # 태그는 리스너가 처리 - 메인 스레드는 3초마다 깨어나 진행 상황만 출력
+            now = start_time
+            while now < deadline and not self._stop.wait(min(3.0, deadline - now)):
+                now = time.monotonic()
+                if now < deadline:
+                    logger.info(f"⏳ {now - start_time:.1f}초 경과, {deadline - now:.1f}초 남음 (태그 {self.tag_count}개)")
             
-            # 8. 정리
+            # 7. 정리
             logger.info("🛑 리스너 중지...")
             self.connector.stopListener()
             
@@ -215,7 +210,7 @@ class FR900ProtocolCorrect:
             self.connector.disconnect()
             
             # 결과 요약
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             logger.info("=" * 70)
             logger.info("📊 프로토콜 준수 EPC 읽기 결과")
             logger.info(f"⏱️  실행 시간: {elapsed:.1f}초")
@@ -7,6 +7,7 @@ esitarski/pyllrp의 TagInventory 클래스를 활용하여 가장 간단하게 E
 """
 
 import sys
+import threading
 import time
 import logging
 from datetime import datetime
@@ -35,6 +36,51 @@ class FR900TagInventoryWrapper:
     def __init__(self, reader_ip):
         self.reader_ip = reader_ip
         self.tag_inventory = None
+        self._stop = threading.Event()  # 연속 읽기 대기용 - 시간 제한까지 블록
+        
+        # 연속 읽기용 ROSpec 값
+        self.ROSPEC_ID = 1234
+        self.INVENTORY_PARAM_ID = 1234
+    
+    def _build_continuous_rospec(self, antenna_ids):
+        """멈추지 않고 태그마다(N=1) 리포트를 보내는 ROSpec"""
+        return ROSpec_Parameter(
+            ROSpecID=self.ROSPEC_ID,
+            CurrentState=ROSpecState.Disabled,
+            Parameters=[
+                ROBoundarySpec_Parameter(Parameters=[
+                    ROSpecStartTrigger_Parameter(
+                        ROSpecStartTriggerType=ROSpecStartTriggerType.Immediate
+                    ),
+                    ROSpecStopTrigger_Parameter(
+                        ROSpecStopTriggerType=ROSpecStopTriggerType.Null
+                    )
+                ]),
+                AISpec_Parameter(
+                    AntennaIDs=antenna_ids,
+                    Parameters=[
+                        AISpecStopTrigger_Parameter(
+                            AISpecStopTriggerType=AISpecStopTriggerType.Null
+                        ),
+                        InventoryParameterSpec_Parameter(
+                            InventoryParameterSpecID=self.INVENTORY_PARAM_ID,
+                            ProtocolID=AirProtocols.EPCGlobalClass1Gen2
+                        )
+                    ]
+                ),
+                ROReportSpec_Parameter(
+                    ROReportTrigger=ROReportTriggerType.Upon_N_Tags_Or_End_Of_ROSpec,
+                    N=1,
+                    Parameters=[
+                        TagReportContentSelector_Parameter(
+                            EnableAntennaID=True,
+                            EnableFirstSeenTimestamp=True,
+                            EnablePeakRSSI=True
+                        )
+                    ]
+                )
+            ]
+        )
     
     def test_basic_inventory(self):
         """기본 태그 인벤토리 테스트"""
@@ -104,7 +150,11 @@ class FR900TagInventoryWrapper:
         power_levels = [10, 20, 30, 50]
         results = {}
         
-        for power in power_levels:
+        # 전송 파워는 연결 시 설정되므로 파워마다 별도 연결
+        for i, power in enumerate(power_levels):
+            if i:
+                time.sleep(1)  # 이전 연결 해제 후 잠깐 대기
+            
             try:
                 logger.info(f"🔋 전력 레벨 {power}로 테스트 중...")
                 
@@ -114,8 +164,11 @@ class FR900TagInventoryWrapper:
                 )
                 
                 ti.Connect()
-                tag_set, _ = ti.GetTagInventory()
-                ti.Disconnect()
+                try:
+                    tag_set, _ = ti.GetTagInventory()
+                finally:
+                    # 읽기가 실패해도 연결은 닫아야 다음 파워에서 다시 연결 가능
+                    ti.Disconnect()
                 
                 results[power] = len(tag_set)
                 logger.info(f"  전력 {power}: {len(tag_set)}개 태그 발견")
@@ -124,8 +177,6 @@ class FR900TagInventoryWrapper:
                     for epc in tag_set:
                         logger.info(f"    EPC: {epc}")
                 
-                time.sleep(1)  # 잠깐 대기
-                
             except Exception as e:
                 logger.error(f"전력 {power} 테스트 실패: {e}")
                 results[power] = -1
@@ -141,9 +192,10 @@ class FR900TagInventoryWrapper:
         return any(count > 0 for count in results.values())
     
     def test_continuous_reading(self, duration=30, power=30):
-        """연속 읽기 테스트"""
+        """연속 읽기 테스트 - ROSpec 하나를 계속 실행하고 태그는 리포트 핸들러로 받음"""
         logger.info(f"=== {duration}초 연속 읽기 테스트 (전력={power}) ===")
         
+        ti = None
         try:
             ti = TagInventory(
                 host=self.reader_ip,
@@ -151,36 +203,52 @@ class FR900TagInventoryWrapper:
                 defaultAntennas=[1]  # 안테나 1만 사용
             )
             
+            # 전력/안테나 설정은 TagInventory 연결에 맡기고, 그 연결 위에 연속 ROSpec 실행
             ti.Connect()
+            connector = ti.connector
             logger.info("✅ 연결 성공")
             
-            start_time = time.time()
+            connector.transact(DELETE_ROSPEC_Message(ROSpecID=0))
+            response = connector.transact(ADD_ROSPEC_Message(Parameters=[self._build_continuous_rospec([1])]))
+            if not response.success():
+                raise Exception(f"ROSpec 추가 실패: {response}")
+            response = connector.transact(ENABLE_ROSPEC_Message(ROSpecID=self.ROSPEC_ID))
+            if not response.success():
+                raise Exception(f"ROSpec 활성화 실패: {response}")
+            
+            start_time = time.monotonic()
             total_reads = 0
             unique_tags = set()
             
-            while (time.time() - start_time) < duration:
-                try:
-                    tag_set, _ = ti.GetTagInventory()
-                    if tag_set:
-                        total_reads += len(tag_set)
-                        unique_tags.update(tag_set)
-                        
-                        elapsed = time.time() - start_time
-                        logger.info(f"⏱️ {elapsed:.1f}초: {len(tag_set)}개 읽음 "
-                                  f"(총 {total_reads}회, 고유 {len(unique_tags)}개)")
-                        
-                        for epc in tag_set:
-                            logger.info(f"   📡 EPC: {epc}")
+            def report_handler(connector, access_report):
+                """리스너 스레드에서 리포트마다 호출 - 집계와 로그만"""
+                nonlocal total_reads
+                tag_set = {HexFormatToStr(tag_data['EPC']) for tag_data in access_report.getTagData()}
+                total_reads += len(tag_set)
+                
+                # 이미 본 태그의 반복 읽기는 개수만 세고, 처음 본 EPC만 로그
+                new_tags = tag_set - unique_tags
+                if new_tags:
+                    unique_tags.update(new_tags)
                     
-                    time.sleep(0.5)  # 0.5초 간격
+                    elapsed = time.monotonic() - start_time
+                    logger.info(f"⏱️ {elapsed:.1f}초: 새 태그 {len(new_tags)}개 "
+                              f"(총 {total_reads}회, 고유 {len(unique_tags)}개)")
                     
-                except Exception as e:
-                    logger.error(f"읽기 중 오류: {e}")
-                    time.sleep(1)
+                    for epc in new_tags:
+                        logger.info(f"   📡 EPC: {epc}")
             
-            ti.Disconnect()
+            # 폴링 없이 리포트가 올 때만 처리 - 메인 스레드는 끝날 때까지 대기만
+            connector.addHandler(RO_ACCESS_REPORT_Message, report_handler)
+            connector.startListener()
+            try:
+                self._stop.wait(duration)
+            finally:
+                connector.stopListener()
+                connector.transact(DISABLE_ROSPEC_Message(ROSpecID=self.ROSPEC_ID))
+                connector.transact(DELETE_ROSPEC_Message(ROSpecID=self.ROSPEC_ID))
             
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             logger.info(f"📊 연속 읽기 완료: {elapsed:.1f}초 동안")
             logger.info(f"   총 읽기 횟수: {total_reads}")
             logger.info(f"   고유 태그 수: {len(unique_tags)}")
@@ -196,6 +264,12 @@ class FR900TagInventoryWrapper:
         except Exception as e:
             logger.error(f"❌ 연속 읽기 테스트 실패: {e}")
             return False
+        finally:
+            if ti:
+                try:
+                    ti.Disconnect()
+                except Exception:
+                    pass
 
 def main():
     """메인 함수"""